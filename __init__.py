@@ -4,33 +4,28 @@ Redis Search Grammar-Based Fuzzer
 A powerful and flexible framework for fuzzing Redis Search queries using grammar-based testing techniques.
 """
 
-from .config.fuzzer_config import FuzzerConfig
-from .config.dialect_config import DialectConfig
-from .grammar.parser import GrammarParser
-from .grammar.rule_expander import RuleExpander
-from .generators.query_generator import QueryGenerator
-from .generators.mutation_engine import MutationEngine
-from .generators.validity_controller import ValidityController
-from .execution.redis_executor import RedisExecutor
-from .execution.result_validator import ResultValidator
-from .execution.monitor import FuzzerMonitor
-from .reporting.error_logger import ErrorLogger
-from .reporting.report_generator import ReportGenerator
+from ._lazy import install
 
 __version__ = "0.1.0"
 __author__ = "Redis Search Fuzzer Team"
 
-__all__ = [
-    "FuzzerConfig",
-    "DialectConfig",
-    "GrammarParser",
-    "RuleExpander",
-    "QueryGenerator",
-    "MutationEngine",
-    "ValidityController",
-    "RedisExecutor",
-    "ResultValidator",
-    "FuzzerMonitor",
-    "ErrorLogger",
-    "ReportGenerator",
-] 
\ No newline at end of file
+# Public names mapped to the submodules defining them. Submodules (and their
+# heavy dependencies such as redis and psutil) are imported on first access.
+_LAZY_EXPORTS = {
+    "FuzzerConfig": ".config.fuzzer_config",
+    "DialectConfig": ".config.dialect_config",
+    "GrammarParser": ".grammar.parser",
+    "RuleExpander": ".grammar.rule_expander",
+    "QueryGenerator": ".generators.query_generator",
+    "MutationEngine": ".generators.mutation_engine",
+    "ValidityController": ".generators.validity_controller",
+    "RedisExecutor": ".execution.redis_executor",
+    "ResultValidator": ".execution.result_validator",
+    "FuzzerMonitor": ".execution.monitor",
+    "ErrorLogger": ".reporting.error_logger",
+    "ReportGenerator": ".reporting.report_generator",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
@@ -0,0 +1,49 @@
+"""Lazy attribute exports for the fuzzer's packages."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def install(
+    module_globals: Dict[str, Any],
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module __getattr__ and __dir__ functions that import exports lazily.
+
+    Each exported name is imported from its submodule on first access and then
+    cached in the module's globals, so later lookups skip __getattr__.
+
+    Args:
+        module_globals: The globals() of the package exporting the names.
+        exports: Public names mapped to the relative submodules defining them.
+
+    Returns:
+        The package's __getattr__ and __dir__ functions.
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """Import public classes on first access.
+
+        Args:
+            name: The attribute being looked up.
+
+        Returns:
+            The requested class.
+
+        Raises:
+            AttributeError: If the name is not exported by the package.
+        """
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """List the package attributes, including lazily imported classes."""
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
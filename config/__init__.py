@@ -1,6 +1,14 @@
 """Configuration package for the Redis Search Fuzzer."""
 
-from .fuzzer_config import FuzzerConfig
-from .dialect_config import DialectConfig
+from .._lazy import install
 
-__all__ = ["FuzzerConfig", "DialectConfig"]
+# Public names mapped to the submodules defining them. Submodules (and their
+# dependencies such as yaml) are imported on first access.
+_LAZY_EXPORTS = {
+    "FuzzerConfig": ".fuzzer_config",
+    "DialectConfig": ".dialect_config",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
@@ -1,7 +1,22 @@
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Tuple, Any, Optional, Pattern
+from enum import IntFlag
+import functools
 import re
 
 
+class Feature(IntFlag):
+    """Redis Search features, encoded as bits of a per-dialect support mask."""
+    
+    FULL_TEXT = 1 << 0
+    NUMERIC = 1 << 1
+    GEO = 1 << 2
+    VECTOR = 1 << 3
+    AGGREGATION = 1 << 4
+    WILDCARD = 1 << 5
+    PARAMETERIZED = 1 << 6
+    DIALECT_SPECIFIER = 1 << 7
+
+
 class DialectConfig:
     """Configuration for Redis Search dialects."""
     
@@ -82,6 +97,9 @@ class DialectConfig:
         }
     }
     
+    # Fully-initialized instances, shared per dialect version
+    _instances: Dict[int, "DialectConfig"] = {}
+    
     def __init__(self, dialect_version: int):
         """Initialize the dialect configuration.
         
@@ -93,13 +111,14 @@ class DialectConfig:
         
         self.dialect_version = dialect_version
         self.dialect_info = self.DIALECT_FEATURES[dialect_version]
-        self._compile_forbidden_patterns()
-    
-    def _compile_forbidden_patterns(self) -> None:
-        """Compile the forbidden patterns for efficient matching."""
-        self.forbidden_regexes = [
-            re.compile(pattern) for pattern in self.dialect_info["forbidden_patterns"]
-        ]
+        
+        # Specialize validation for this dialect, shadowing is_query_valid:
+        # without forbidden patterns every query is valid, otherwise the
+        # memoized validator is bound to the dialect version up front
+        if _FORBIDDEN_UNIONS[dialect_version] is None:
+            self.is_query_valid = _always_valid
+        else:
+            self.is_query_valid = functools.partial(_validate, dialect_version)
     
     def is_feature_supported(self, feature: str) -> bool:
         """Check if a feature is supported in this dialect.
@@ -110,18 +129,16 @@ class DialectConfig:
         Returns:
             True if the feature is supported, False otherwise.
         """
-        return self.dialect_info["features"].get(feature, False)
+        flag = Feature.__members__.get(feature.upper())
+        return flag is not None and bool(_FEATURE_MASKS[self.dialect_version] & flag)
     
-    def get_supported_features(self) -> List[str]:
-        """Get the list of supported features for this dialect.
+    def get_supported_features(self) -> Tuple[str, ...]:
+        """Get the supported features for this dialect.
         
         Returns:
-            List of supported feature names.
+            Tuple of supported feature names.
         """
-        return [
-            feature for feature, supported in self.dialect_info["features"].items()
-            if supported
-        ]
+        return _SUPPORTED_FEATURES[self.dialect_version]
     
     def is_query_valid(self, query: str) -> bool:
         """Check if a query is valid for this dialect.
@@ -132,12 +149,7 @@ class DialectConfig:
         Returns:
             True if the query is valid, False otherwise.
         """
-        # Check for forbidden patterns
-        for pattern in self.forbidden_regexes:
-            if pattern.search(query):
-                return False
-        
-        return True
+        return _validate(self.dialect_version, query)
     
     def get_dialect_name(self) -> str:
         """Get the name of this dialect.
@@ -163,6 +175,32 @@ class DialectConfig:
         """
         return self.dialect_info["forbidden_patterns"]
     
+    @classmethod
+    def get(cls, dialect_version: int) -> "DialectConfig":
+        """Get the shared configuration instance for a dialect version.
+        
+        Dialect configurations are immutable, so the instance (and its compiled
+        forbidden patterns) is built once per process and reused.
+        
+        Args:
+            dialect_version: The Redis Search dialect version (1-4).
+            
+        Returns:
+            The cached DialectConfig instance.
+            
+        Raises:
+            ValueError: If the dialect version is not supported.
+        """
+        instance = cls._instances.get(dialect_version)
+        if instance is None:
+            instance = cls._instances[dialect_version] = cls(dialect_version)
+        return instance
+    
+    @staticmethod
+    def clear_validation_cache() -> None:
+        """Clear the memoized query validation results shared by all dialects."""
+        _validate.cache_clear()
+    
     @classmethod
     def get_supported_dialects(cls) -> List[int]:
         """Get the list of supported dialect versions.
@@ -189,3 +227,85 @@ class DialectConfig:
             raise ValueError(f"Unsupported dialect version: {dialect_version}")
         
         return cls.DIALECT_FEATURES[dialect_version]
+
+
+# Supported features per dialect, packed into a single bitmask
+_FEATURE_MASKS: Dict[int, Feature] = {
+    version: functools.reduce(
+        lambda mask, flag: mask | flag,
+        (Feature[feature.upper()] for feature, supported in info["features"].items() if supported),
+        Feature(0)
+    )
+    for version, info in DialectConfig.DIALECT_FEATURES.items()
+}
+
+
+# Supported feature names per dialect, in Feature declaration order
+_SUPPORTED_FEATURES: Dict[int, Tuple[str, ...]] = {
+    version: tuple(flag.name.lower() for flag in Feature if mask & flag)
+    for version, mask in _FEATURE_MASKS.items()
+}
+
+
+# Escapes, character classes and capturing group openers in a regex pattern
+_GROUP_TOKEN_RE = re.compile(r"\\.|\[(?:\\.|[^\]\\])*\]|\((?!\?)")
+
+
+def _non_capturing(pattern: str) -> str:
+    """Rewrite the capturing groups of a pattern as non-capturing groups.
+    
+    Forbidden patterns are only tested for a match, so group captures are
+    pure overhead. Escaped parentheses and parentheses inside character
+    classes are left untouched; forbidden patterns must therefore not use
+    numbered backreferences.
+    
+    Args:
+        pattern: The regex pattern to rewrite.
+        
+    Returns:
+        The pattern with every "(" group opener replaced by "(?:".
+    """
+    return _GROUP_TOKEN_RE.sub(
+        lambda match: "(?:" if match.group() == "(" else match.group(),
+        pattern
+    )
+
+
+# Forbidden patterns per dialect, combined into a single alternation of
+# non-capturing groups and compiled once at import time
+_FORBIDDEN_UNIONS: Dict[int, Optional[Pattern[str]]] = {
+    version: re.compile("|".join(
+        f"(?:{_non_capturing(pattern)})" for pattern in info["forbidden_patterns"]
+    ))
+    if info["forbidden_patterns"] else None
+    for version, info in DialectConfig.DIALECT_FEATURES.items()
+}
+
+
+@functools.lru_cache(maxsize=65536)
+def _validate(dialect_version: int, query: str) -> bool:
+    """Check a query against a dialect's forbidden patterns.
+    
+    Generated queries repeat often, so results are memoized per process.
+    
+    Args:
+        dialect_version: The dialect version to validate against.
+        query: The query to validate.
+        
+    Returns:
+        True if no forbidden pattern matches the query, False otherwise.
+    """
+    forbidden = _FORBIDDEN_UNIONS[dialect_version]
+    return forbidden is None or forbidden.search(query) is None
+
+
+def _always_valid(query: str) -> bool:
+    """Validate a query for a dialect without forbidden patterns.
+    
+    Args:
+        query: The query to validate.
+        
+    Returns:
+        Always True.
+    """
+    return True
@@ -1,6 +1,15 @@
 import os
+import copy
+import orjson
 import yaml
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class FuzzerConfig:
@@ -17,6 +26,7 @@ class FuzzerConfig:
         "valid_query_ratio": 0.7,  # Percentage of valid queries
         "max_query_length": 1000,  # Maximum query length
         "max_generation_depth": 20,  # Rule expansion depth
+        "generation_workers": 1,  # Worker processes for batch generation
         
         # Execution control
         "queries_per_second": 100,  # Query rate limit
@@ -41,21 +51,51 @@ class FuzzerConfig:
         """Initialize the fuzzer configuration.
         
         Args:
-            config_path: Path to a YAML configuration file. If None, default config is used.
+            config_path: Path to a YAML or JSON configuration file. If None, default config is used.
         """
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         
         if config_path and os.path.exists(config_path):
             self._load_config(config_path)
+        
+        self._build_sub_configs()
+    
+    def _build_sub_configs(self) -> None:
+        """Build the read-only sub-configuration views returned by the getters."""
+        self._redis_config = MappingProxyType({
+            "host": self.config["redis_host"],
+            "port": self.config["redis_port"],
+            "password": self.config["redis_password"]
+        })
+        self._execution_config = MappingProxyType({
+            "queries_per_second": self.config["queries_per_second"],
+            "timeout_ms": self.config["timeout_ms"],
+            "test_duration_seconds": self.config["test_duration_seconds"]
+        })
+        self._generation_config = MappingProxyType({
+            "valid_query_ratio": self.config["valid_query_ratio"],
+            "max_query_length": self.config["max_query_length"],
+            "max_generation_depth": self.config["max_generation_depth"],
+            "generation_workers": self.config["generation_workers"]
+        })
+        self._reporting_config = MappingProxyType({
+            "log_file": self.config["log_file"],
+            "log_level": self.config["log_level"]
+        })
     
     def _load_config(self, config_path: str) -> None:
-        """Load configuration from a YAML file.
+        """Load configuration from a YAML or JSON file.
         
         Args:
-            config_path: Path to the YAML configuration file.
+            config_path: Path to the configuration file. Files with a ".json"
+                suffix are parsed as JSON, anything else as YAML.
         """
-        with open(config_path, 'r') as f:
-            user_config = yaml.safe_load(f)
+        if config_path.endswith(".json"):
+            with open(config_path, 'rb') as f:
+                user_config = orjson.loads(f.read())
+        else:
+            with open(config_path, 'r') as f:
+                user_config = yaml.load(f, Loader=_YamlLoader)
             
         # Update default config with user values
         if user_config:
@@ -94,6 +134,15 @@ class FuzzerConfig:
             value: The value to set.
         """
         self.config[key] = value
+        self._build_sub_configs()
+    
+    def get_all(self) -> Dict[str, Any]:
+        """Get the complete configuration.
+        
+        Returns:
+            Dictionary with all configuration values.
+        """
+        return self.config
     
     def get_dialect_versions(self) -> List[int]:
         """Get the list of dialect versions to test.
@@ -111,49 +160,66 @@ class FuzzerConfig:
         """
         return self.config["feature_weights"]
     
-    def get_redis_config(self) -> Dict[str, Any]:
+    def get_redis_config(self) -> Mapping[str, Any]:
         """Get the Redis connection configuration.
         
         Returns:
-            Dictionary with Redis connection parameters.
+            Read-only mapping with Redis connection parameters.
         """
-        return {
-            "host": self.config["redis_host"],
-            "port": self.config["redis_port"],
-            "password": self.config["redis_password"]
-        }
+        return self._redis_config
     
-    def get_execution_config(self) -> Dict[str, Any]:
+    def get_redis_host(self) -> str:
+        """Get the Redis host.
+        
+        Returns:
+            The Redis server host name.
+        """
+        return self._redis_config["host"]
+    
+    def get_redis_port(self) -> int:
+        """Get the Redis port.
+        
+        Returns:
+            The Redis server port.
+        """
+        return self._redis_config["port"]
+    
+    def get_redis_password(self) -> Optional[str]:
+        """Get the Redis password.
+        
+        Returns:
+            The Redis password, or None if authentication is disabled.
+        """
+        return self._redis_config["password"]
+    
+    def get_execution_config(self) -> Mapping[str, Any]:
         """Get the execution configuration.
         
         Returns:
-            Dictionary with execution parameters.
+            Read-only mapping with execution parameters.
         """
-        return {
-            "queries_per_second": self.config["queries_per_second"],
-            "timeout_ms": self.config["timeout_ms"],
-            "test_duration_seconds": self.config["test_duration_seconds"]
-        }
+        return self._execution_config
+    
+    def get_timeout_ms(self) -> int:
+        """Get the query timeout.
+        
+        Returns:
+            The query timeout in milliseconds.
+        """
+        return self._execution_config["timeout_ms"]
     
-    def get_generation_config(self) -> Dict[str, Any]:
+    def get_generation_config(self) -> Mapping[str, Any]:
         """Get the query generation configuration.
         
         Returns:
-            Dictionary with generation parameters.
+            Read-only mapping with generation parameters.
         """
-        return {
-            "valid_query_ratio": self.config["valid_query_ratio"],
-            "max_query_length": self.config["max_query_length"],
-            "max_generation_depth": self.config["max_generation_depth"]
-        }
+        return self._generation_config
     
-    def get_reporting_config(self) -> Dict[str, Any]:
+    def get_reporting_config(self) -> Mapping[str, Any]:
         """Get the reporting configuration.
         
         Returns:
-            Dictionary with reporting parameters.
+            Read-only mapping with reporting parameters.
         """
-        return {
-            "log_file": self.config["log_file"],
-            "log_level": self.config["log_level"]
-        }
+        return self._reporting_config
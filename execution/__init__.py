@@ -1,7 +1,15 @@
 """Execution package for running and monitoring Redis Search queries."""
 
-from .redis_executor import RedisExecutor
-from .result_validator import ResultValidator
-from .monitor import FuzzerMonitor
+from .._lazy import install
 
-__all__ = ["RedisExecutor", "ResultValidator", "FuzzerMonitor"]
+# Public names mapped to the submodules defining them. Submodules (and their
+# dependencies such as redis and psutil) are imported on first access.
+_LAZY_EXPORTS = {
+    "RedisExecutor": ".redis_executor",
+    "ResultValidator": ".result_validator",
+    "FuzzerMonitor": ".monitor",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
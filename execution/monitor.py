@@ -1,19 +1,80 @@
 import time
 import psutil
 import asyncio
-from typing import List, Dict, Optional, Set, Tuple, Any, Union
-from datetime import datetime
+import functools
+import operator
+import numpy as np
+import orjson
+from typing import List, Dict, Optional, Set, Tuple, Any, Union, Callable
+
+
+# Layout of a single metrics sample in the history ring buffer
+_METRICS_DTYPE = np.dtype([
+    ("ts", "f8"),
+    ("elapsed", "f8"),
+    ("cpu", "f8"),
+    ("mem", "f8"),
+    ("rss", "i8"),
+    ("vms", "i8"),
+    ("rb", "i8"),
+    ("wb", "i8"),
+    ("threads", "i4"),
+    ("fds", "i4")
+])
+
+# Metric names accepted by get_metrics_trend, mapped to ring buffer fields
+_METRIC_FIELDS = {
+    "timestamp": "ts",
+    "elapsed_time": "elapsed",
+    "cpu_percent": "cpu",
+    "memory_percent": "mem",
+    "memory_info.rss": "rss",
+    "memory_info.vms": "vms",
+    "io_counters.read_bytes": "rb",
+    "io_counters.write_bytes": "wb",
+    "num_threads": "threads",
+    "num_fds": "fds"
+}
+
+# Handle for the current process, reused across samples
+_PROC = psutil.Process()
 
 
 class FuzzerMonitor:
     """Monitors the fuzzer's execution and resource usage."""
     
-    def __init__(self):
-        """Initialize the fuzzer monitor."""
+    def __init__(self, history_size: int = 3600, spill_file: Optional[str] = None):
+        """Initialize the fuzzer monitor.
+        
+        Args:
+            history_size: Number of samples kept in memory. Older samples are
+                overwritten, so memory use stays constant for long runs.
+            spill_file: Optional path of a JSON-lines file that samples are
+                appended to before they are overwritten.
+                
+        Raises:
+            ValueError: If history_size is less than 1.
+        """
+        if history_size < 1:
+            raise ValueError(f"Invalid history size: {history_size}")
+        
         self.start_time = time.time()
-        self.metrics_history: List[Dict[str, Any]] = []
+        self.history_size = history_size
+        self.spill_file = spill_file
         self.is_monitoring = False
         self.monitor_task: Optional[asyncio.Task] = None
+        
+        # Ring buffer of metric samples
+        self._history = np.zeros(history_size, dtype=_METRICS_DTYPE)
+        self._write_index = 0
+        self._sample_count = 0
+        
+        # Whole-run aggregates, kept outside the ring buffer so the summary
+        # still covers samples that have been overwritten
+        self._reset_totals()
+        
+        # Last computed summary, keyed by the sample count it was computed at
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
     
     async def start_monitoring(self, interval_seconds: float = 1.0) -> None:
         """Start monitoring the fuzzer.
@@ -48,34 +109,132 @@ class FuzzerMonitor:
         Args:
             interval_seconds: Interval between metric collection in seconds.
         """
+        # Sleep until a fixed schedule of deadlines so collection time does not
+        # accumulate as drift
+        deadline = time.monotonic()
         while self.is_monitoring:
-            metrics = self._collect_metrics()
-            self.metrics_history.append(metrics)
-            await asyncio.sleep(interval_seconds)
+            self._record_metrics(self._collect_metrics())
+            deadline += interval_seconds
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
     
-    def _collect_metrics(self) -> Dict[str, Any]:
+    def _collect_metrics(self) -> Tuple[Any, ...]:
         """Collect current metrics.
         
         Returns:
-            Dictionary containing current metrics.
+            Tuple of metric values laid out as a ring buffer row.
+        """
+        process = _PROC
+        now = time.time()
+        
+        # Each psutil call is a separate syscall, so query each counter once
+        memory_info = process.memory_info()
+        io_counters = process.io_counters()
+        
+        return (
+            now,
+            now - self.start_time,
+            process.cpu_percent(),
+            process.memory_percent(),
+            memory_info.rss,
+            memory_info.vms,
+            io_counters.read_bytes,
+            io_counters.write_bytes,
+            process.num_threads(),
+            process.num_fds() if hasattr(process, "num_fds") else -1
+        )
+    
+    def _record_metrics(self, sample: Tuple[Any, ...]) -> None:
+        """Store a metrics sample in the ring buffer.
+        
+        Args:
+            sample: Metric values as returned by _collect_metrics.
         """
-        process = psutil.Process()
+        if self._sample_count >= self.history_size and self._write_index == 0:
+            # The buffer is full and about to wrap; keep the samples on disk
+            self._spill_history()
         
+        self._history[self._write_index] = sample
+        self._write_index = (self._write_index + 1) % self.history_size
+        self._sample_count += 1
+        
+        row = self._history[self._write_index - 1]
+        if self._first_io is None:
+            self._first_io = (int(row["rb"]), int(row["wb"]))
+        self._cpu_sum += float(row["cpu"])
+        self._mem_sum += float(row["mem"])
+        self._max_rss = max(self._max_rss, int(row["rss"]))
+    
+    def _reset_totals(self) -> None:
+        """Reset the whole-run aggregates used by get_summary_stats."""
+        self._first_io: Optional[Tuple[int, int]] = None
+        self._cpu_sum = 0.0
+        self._mem_sum = 0.0
+        self._max_rss = 0
+    
+    def _spill_history(self) -> None:
+        """Append the buffered samples to the spill file, if one is configured."""
+        if self.spill_file is None:
+            return
+        
+        with open(self.spill_file, "ab") as f:
+            f.write(b"".join(
+                orjson.dumps(self._row_to_dict(row)) + b"\n"
+                for row in self._history
+            ))
+    
+    def _ordered_history(self) -> np.ndarray:
+        """Get the buffered samples in chronological order.
+        
+        Returns:
+            Structured array of the retained samples, oldest first.
+        """
+        if self._sample_count < self.history_size:
+            return self._history[:self._sample_count]
+        return np.concatenate((
+            self._history[self._write_index:],
+            self._history[:self._write_index]
+        ))
+    
+    def _recent_history(self, count: int) -> np.ndarray:
+        """Get the most recent buffered samples in chronological order.
+        
+        Args:
+            count: Maximum number of samples to return.
+            
+        Returns:
+            Structured array of at most count samples, oldest first.
+        """
+        if count >= min(self._sample_count, self.history_size):
+            return self._ordered_history()
+        
+        indices = np.arange(self._write_index - count, self._write_index) % self.history_size
+        return self._history[indices]
+    
+    @staticmethod
+    def _row_to_dict(row: np.void) -> Dict[str, Any]:
+        """Convert a ring buffer row to a metrics dictionary.
+        
+        Args:
+            row: A single sample from the ring buffer.
+            
+        Returns:
+            Dictionary containing the sample's metrics.
+        """
         return {
-            "timestamp": datetime.now().isoformat(),
-            "elapsed_time": time.time() - self.start_time,
-            "cpu_percent": process.cpu_percent(),
-            "memory_percent": process.memory_percent(),
+            "timestamp": float(row["ts"]),
+            "elapsed_time": float(row["elapsed"]),
+            "cpu_percent": float(row["cpu"]),
+            "memory_percent": float(row["mem"]),
             "memory_info": {
-                "rss": process.memory_info().rss,
-                "vms": process.memory_info().vms
+                "rss": int(row["rss"]),
+                "vms": int(row["vms"])
             },
             "io_counters": {
-                "read_bytes": process.io_counters().read_bytes,
-                "write_bytes": process.io_counters().write_bytes
+                "read_bytes": int(row["rb"]),
+                "write_bytes": int(row["wb"])
             },
-            "num_threads": process.num_threads(),
-            "num_fds": process.num_fds() if hasattr(process, "num_fds") else None
+            "num_threads": int(row["threads"]),
+            "num_fds": int(row["fds"]) if row["fds"] >= 0 else None
         }
     
     def get_current_metrics(self) -> Dict[str, Any]:
@@ -84,25 +243,27 @@ class FuzzerMonitor:
         Returns:
             Dictionary containing the most recent metrics.
         """
-        if not self.metrics_history:
-            return self._collect_metrics()
-        return self.metrics_history[-1]
+        if not self._sample_count:
+            return self._row_to_dict(np.array(self._collect_metrics(), dtype=_METRICS_DTYPE))
+        return self._row_to_dict(self._history[self._write_index - 1])
     
     def get_metrics_history(self) -> List[Dict[str, Any]]:
-        """Get the complete metrics history.
+        """Get the retained metrics history.
         
         Returns:
-            List of metric dictionaries.
+            List of metric dictionaries, oldest first.
         """
-        return self.metrics_history
+        return [self._row_to_dict(row) for row in self._ordered_history()]
     
     def get_summary_stats(self) -> Dict[str, Any]:
-        """Get summary statistics from the metrics history.
+        """Get summary statistics over every sample since monitoring began.
+        
+        The statistics include samples already overwritten in the ring buffer.
         
         Returns:
             Dictionary containing summary statistics.
         """
-        if not self.metrics_history:
+        if not self._sample_count:
             return {
                 "total_time": 0,
                 "avg_cpu_percent": 0,
@@ -112,24 +273,29 @@ class FuzzerMonitor:
                 "total_io_write": 0
             }
         
-        cpu_percents = [m["cpu_percent"] for m in self.metrics_history]
-        memory_percents = [m["memory_percent"] for m in self.metrics_history]
-        memory_usage = [m["memory_info"]["rss"] for m in self.metrics_history]
-        io_read = [m["io_counters"]["read_bytes"] for m in self.metrics_history]
-        io_write = [m["io_counters"]["write_bytes"] for m in self.metrics_history]
+        if self._summary_cache is not None and self._summary_cache[0] == self._sample_count:
+            return self._summary_cache[1]
         
-        return {
-            "total_time": self.metrics_history[-1]["elapsed_time"],
-            "avg_cpu_percent": sum(cpu_percents) / len(cpu_percents),
-            "avg_memory_percent": sum(memory_percents) / len(memory_percents),
-            "max_memory_usage": max(memory_usage),
-            "total_io_read": io_read[-1] - io_read[0],
-            "total_io_write": io_write[-1] - io_write[0]
+        latest = self._history[self._write_index - 1]
+        first_read, first_write = self._first_io
+        
+        summary = {
+            "total_time": float(latest["elapsed"]),
+            "avg_cpu_percent": self._cpu_sum / self._sample_count,
+            "avg_memory_percent": self._mem_sum / self._sample_count,
+            "max_memory_usage": self._max_rss,
+            "total_io_read": int(latest["rb"]) - first_read,
+            "total_io_write": int(latest["wb"]) - first_write
         }
+        self._summary_cache = (self._sample_count, summary)
+        return summary
     
     def clear_history(self) -> None:
         """Clear the metrics history."""
-        self.metrics_history.clear()
+        self._write_index = 0
+        self._sample_count = 0
+        self._reset_totals()
+        self._summary_cache = None
         self.start_time = time.time()
     
     def get_resource_warnings(self) -> List[Dict[str, Any]]:
@@ -140,36 +306,34 @@ class FuzzerMonitor:
         """
         warnings = []
         
-        if not self.metrics_history:
+        if not self._sample_count:
             return warnings
         
-        latest_metrics = self.metrics_history[-1]
+        latest_metrics = self._history[self._write_index - 1]
         
         # Check CPU usage
-        if latest_metrics["cpu_percent"] > 90:
+        if latest_metrics["cpu"] > 90:
             warnings.append({
                 "type": "high_cpu",
-                "value": latest_metrics["cpu_percent"],
+                "value": float(latest_metrics["cpu"]),
                 "threshold": 90
             })
         
         # Check memory usage
-        if latest_metrics["memory_percent"] > 80:
+        if latest_metrics["mem"] > 80:
             warnings.append({
                 "type": "high_memory",
-                "value": latest_metrics["memory_percent"],
+                "value": float(latest_metrics["mem"]),
                 "threshold": 80
             })
         
         # Check I/O rate
-        if len(self.metrics_history) >= 2:
-            prev_metrics = self.metrics_history[-2]
-            time_diff = latest_metrics["elapsed_time"] - prev_metrics["elapsed_time"]
+        if self._sample_count >= 2:
+            prev_metrics = self._history[self._write_index - 2]
+            time_diff = float(latest_metrics["elapsed"] - prev_metrics["elapsed"])
             
-            read_rate = (latest_metrics["io_counters"]["read_bytes"] -
-                        prev_metrics["io_counters"]["read_bytes"]) / time_diff
-            write_rate = (latest_metrics["io_counters"]["write_bytes"] -
-                         prev_metrics["io_counters"]["write_bytes"]) / time_diff
+            read_rate = int(latest_metrics["rb"] - prev_metrics["rb"]) / time_diff
+            write_rate = int(latest_metrics["wb"] - prev_metrics["wb"]) / time_diff
             
             if read_rate > 1e6:  # 1 MB/s
                 warnings.append({
@@ -191,30 +355,33 @@ class FuzzerMonitor:
         """Get the trend of a specific metric.
         
         Args:
-            metric_name: Name of the metric to track.
+            metric_name: Name of the metric to track (nested metrics use dotted
+                names, e.g. "memory_info.rss").
             window_size: Number of recent values to return.
             
         Returns:
             List of recent metric values.
         """
-        if not self.metrics_history:
+        accessor = _metric_accessor(metric_name)
+        if accessor is None or not self._sample_count or window_size <= 0:
             return []
         
-        values = []
-        for metrics in self.metrics_history[-window_size:]:
-            if metric_name in metrics:
-                values.append(metrics[metric_name])
-            elif "." in metric_name:
-                # Handle nested metrics (e.g., "memory_info.rss")
-                parts = metric_name.split(".")
-                value = metrics
-                for part in parts:
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        value = None
-                        break
-                if value is not None:
-                    values.append(value)
-        
-        return values
+        return accessor(self._recent_history(window_size)).tolist()
+
+
+@functools.lru_cache(maxsize=None)
+def _metric_accessor(metric_name: str) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Resolve a metric name to a column accessor over history samples.
+    
+    Args:
+        metric_name: A metric name as used in the metrics dictionaries (nested
+            metrics use dotted names), or a ring buffer field name.
+        
+    Returns:
+        Callable extracting the metric's column from a structured array, or
+        None if the metric is unknown.
+    """
+    field = _METRIC_FIELDS.get(metric_name)
+    if field is None and metric_name in _METRICS_DTYPE.names:
+        field = metric_name
+    return operator.itemgetter(field) if field is not None else None
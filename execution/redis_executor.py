@@ -1,26 +1,138 @@
 import redis
+import redis.asyncio as aioredis
 import asyncio
+import heapq
+import time
+from collections import OrderedDict, deque
 from typing import List, Dict, Optional, Set, Tuple, Any, Union
 from ..config.fuzzer_config import FuzzerConfig
 
 
+# Upper bound on connections in a shared pool
+_MAX_POOL_CONNECTIONS = 64
+
+# Pool settings: (host, port, password, queries per second, timeout in ms)
+_PoolKey = Tuple[str, int, Optional[str], int, int]
+
+# Connection pools shared by executors, per event loop. A pool's connections
+# belong to the loop that opened them, so each loop has its own pools
+_POOLS: Dict[asyncio.AbstractEventLoop, Dict[_PoolKey, aioredis.BlockingConnectionPool]] = {}
+
+
+def _pool_key(config: FuzzerConfig) -> _PoolKey:
+    """Get the settings that identify a shared connection pool.
+    
+    Args:
+        config: Fuzzer configuration instance.
+        
+    Returns:
+        The pool key for the configured server, request rate and timeout.
+    """
+    return (
+        config.get_redis_host(),
+        config.get_redis_port(),
+        config.get_redis_password(),
+        config.get_execution_config()["queries_per_second"],
+        config.get_timeout_ms()
+    )
+
+
+def _get_connection_pool(config: FuzzerConfig) -> aioredis.BlockingConnectionPool:
+    """Get the shared connection pool for a Redis server on the running loop.
+    
+    Executors share a pool only when they run on the same event loop and also
+    agree on the request rate and query timeout, since those set the pool's
+    size and wait time. Must be called from a coroutine.
+    
+    Args:
+        config: Fuzzer configuration instance.
+        
+    Returns:
+        The connection pool for the configured server, created on first use.
+    """
+    # Pools of closed loops can never be used again
+    for closed_loop in [loop for loop in _POOLS if loop.is_closed()]:
+        del _POOLS[closed_loop]
+    
+    key = _pool_key(config)
+    pools = _POOLS.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(key)
+    if pool is None:
+        # Size the pool to the request rate, since that bounds how many
+        # queries can be in flight at once. A query that finds every
+        # connection busy waits for one to be released instead of failing
+        host, port, password, queries_per_second, timeout_ms = key
+        pool = pools[key] = aioredis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            password=password,
+            max_connections=max(1, min(queries_per_second, _MAX_POOL_CONNECTIONS)),
+            timeout=timeout_ms / 1000,
+            decode_responses=True
+        )
+    return pool
+
+
 class RedisExecutor:
     """Executes Redis Search queries against a Redis server."""
     
-    def __init__(self, config: FuzzerConfig):
+    def __init__(self, config: FuzzerConfig, max_history: int = 100000, max_slow_queries: int = 1000):
         """Initialize the Redis executor.
         
         Args:
             config: Fuzzer configuration instance.
+            max_history: Maximum number of queries kept in the execution history.
+                The least recently executed queries are evicted first.
+            max_slow_queries: Number of slowest successful executions tracked.
         """
         self.config = config
-        self.redis_client = redis.Redis(
-            host=config.get_redis_host(),
-            port=config.get_redis_port(),
-            password=config.get_redis_password(),
-            decode_responses=True
-        )
-        self.execution_history: Dict[str, Dict[str, Any]] = {}
+        
+        # Clients per event loop, created on first use within each loop
+        self._clients: Dict[asyncio.AbstractEventLoop, aioredis.Redis] = {}
+        self.max_history = max_history
+        self.execution_history: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Running aggregates over every execution, independent of eviction
+        self._stats = self._empty_stats()
+        
+        # Slowest successful executions as a min-heap of (execution_time, query),
+        # and the most recent failures
+        self.max_slow_queries = max_slow_queries
+        self._slow: List[Tuple[float, str]] = []
+        self._errors: "deque[Dict[str, Any]]" = deque(maxlen=max_history)
+    
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        """Redis client using the running event loop's connection pool.
+        
+        Must be accessed from a coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            for closed_loop in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed_loop]
+            client = self._clients[loop] = aioredis.Redis(connection_pool=_get_connection_pool(self.config))
+        return client
+    
+    async def aclose(self) -> None:
+        """Disconnect the connection pool used on the running event loop.
+        
+        The pool is no longer handed out to new executors. Other executors
+        already sharing it reconnect on their next query.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.pop(loop, None)
+        if client is None:
+            return
+        
+        pools = _POOLS.get(loop, {})
+        key = _pool_key(self.config)
+        if pools.get(key) is client.connection_pool:
+            del pools[key]
+            if not pools:
+                del _POOLS[loop]
+        await client.connection_pool.disconnect()
     
     async def execute_query(self, query: str, index_name: str = "idx") -> Dict[str, Any]:
         """Execute a Redis Search query.
@@ -41,7 +153,7 @@ class RedisExecutor:
             
             execution_info = {
                 "success": True,
-                "result": result,
+                "result_summary": self._summarize_result(result["result"]),
                 "error": None,
                 "execution_time": result.get("execution_time", 0)
             }
@@ -49,7 +161,7 @@ class RedisExecutor:
         except asyncio.TimeoutError:
             execution_info = {
                 "success": False,
-                "result": None,
+                "result_summary": None,
                 "error": "Query execution timed out",
                 "execution_time": self.config.get_timeout_ms()
             }
@@ -57,7 +169,7 @@ class RedisExecutor:
         except redis.RedisError as e:
             execution_info = {
                 "success": False,
-                "result": None,
+                "result_summary": None,
                 "error": str(e),
                 "execution_time": 0
             }
@@ -65,13 +177,13 @@ class RedisExecutor:
         except Exception as e:
             execution_info = {
                 "success": False,
-                "result": None,
+                "result_summary": None,
                 "error": f"Unexpected error: {str(e)}",
                 "execution_time": 0
             }
         
         # Record execution history
-        self.execution_history[query] = execution_info
+        self._record_execution(query, execution_info)
         
         return execution_info
     
@@ -85,31 +197,171 @@ class RedisExecutor:
         Returns:
             Dictionary containing query results and metadata.
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
-        # Execute the query
-        result = self.redis_client.ft(index_name).search(query)
+        # Execute the query without blocking the event loop
+        result = await self.redis_client.ft(index_name).search(query)
         
-        end_time = asyncio.get_event_loop().time()
-        execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
         
         return {
             "result": result,
             "execution_time": execution_time
         }
     
-    async def execute_query_batch(self, queries: List[str], index_name: str = "idx") -> List[Dict[str, Any]]:
+    @staticmethod
+    def _summarize_result(result: Any) -> Dict[str, Any]:
+        """Summarize a search result so the full documents are not retained.
+        
+        Args:
+            result: A search result, either a parsed search result object or a
+                raw FT.SEARCH reply (RESP2 list or RESP3 map).
+            
+        Returns:
+            Dictionary with the total match count and the number of returned documents.
+        """
+        if isinstance(result, dict):
+            total = result.get("total_results")
+            num_docs = len(result.get("results", []))
+        elif isinstance(result, (list, tuple)):
+            # [total, id1, fields1, id2, fields2, ...]
+            total = result[0] if result else None
+            num_docs = (len(result) - 1) // 2 if result else 0
+        else:
+            total = getattr(result, "total", None)
+            num_docs = len(getattr(result, "docs", []))
+        
+        return {
+            "total": total,
+            "num_docs": num_docs
+        }
+    
+    async def execute_query_batch(
+        self,
+        queries: List[str],
+        index_name: str = "idx",
+        per_query_timeout: bool = False
+    ) -> List[Dict[str, Any]]:
         """Execute a batch of queries.
         
+        By default all queries are sent in a single non-transactional pipeline,
+        so the batch costs one round trip and the timeout applies to the batch
+        as a whole. Execution times are then the batch time amortized over its
+        queries.
+        
         Args:
             queries: List of queries to execute.
             index_name: Name of the index to search.
+            per_query_timeout: If True, run the queries concurrently, each with
+                its own timeout and execution time, instead of pipelining them.
             
         Returns:
             List of execution results.
         """
-        tasks = [self.execute_query(query, index_name) for query in queries]
-        return await asyncio.gather(*tasks)
+        if per_query_timeout:
+            tasks = [self.execute_query(query, index_name) for query in queries]
+            return await asyncio.gather(*tasks)
+        
+        if not queries:
+            return []
+        
+        start_time = time.perf_counter_ns()
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for query in queries:
+                    pipe.execute_command("FT.SEARCH", index_name, query)
+                responses = await asyncio.wait_for(
+                    pipe.execute(raise_on_error=False),
+                    timeout=self.config.get_timeout_ms() / 1000
+                )
+            
+        except asyncio.TimeoutError:
+            return self._record_batch_failure(
+                queries, "Query execution timed out", self.config.get_timeout_ms()
+            )
+            
+        except redis.RedisError as e:
+            return self._record_batch_failure(queries, str(e), 0)
+            
+        except Exception as e:
+            return self._record_batch_failure(queries, f"Unexpected error: {str(e)}", 0)
+        
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6 / len(queries)  # Milliseconds per query
+        
+        results = []
+        for query, response in zip(queries, responses):
+            if isinstance(response, Exception):
+                execution_info = {
+                    "success": False,
+                    "result_summary": None,
+                    "error": str(response),
+                    "execution_time": 0
+                }
+            else:
+                execution_info = {
+                    "success": True,
+                    "result_summary": self._summarize_result(response),
+                    "error": None,
+                    "execution_time": execution_time
+                }
+            
+            self._record_execution(query, execution_info)
+            results.append(execution_info)
+        
+        return results
+    
+    def _record_batch_failure(self, queries: List[str], error: str, execution_time: float) -> List[Dict[str, Any]]:
+        """Record the same failure for every query of a batch.
+        
+        Args:
+            queries: The queries of the failed batch.
+            error: The error message.
+            execution_time: Execution time to record, in milliseconds.
+            
+        Returns:
+            List of execution results.
+        """
+        results = []
+        for query in queries:
+            execution_info = {
+                "success": False,
+                "result_summary": None,
+                "error": error,
+                "execution_time": execution_time
+            }
+            self._record_execution(query, execution_info)
+            results.append(execution_info)
+        return results
+    
+    def _record_execution(self, query: str, execution_info: Dict[str, Any]) -> None:
+        """Record an execution in the bounded history and the running aggregates.
+        
+        Args:
+            query: The executed query.
+            execution_info: The execution result.
+        """
+        stats = self._stats
+        stats["total"] += 1
+        if execution_info["success"]:
+            execution_time = execution_info["execution_time"]
+            stats["ok"] += 1
+            stats["time_sum"] += execution_time
+            stats["time_n"] += 1
+            
+            if len(self._slow) < self.max_slow_queries:
+                heapq.heappush(self._slow, (execution_time, query))
+            elif execution_time > self._slow[0][0]:
+                heapq.heapreplace(self._slow, (execution_time, query))
+        else:
+            stats["fail"] += 1
+            self._errors.append({"query": query, "error": execution_info["error"]})
+        
+        history = self.execution_history
+        history[query] = execution_info
+        history.move_to_end(query)
+        if len(history) > self.max_history:
+            history.popitem(last=False)
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get statistics about query execution.
@@ -117,7 +369,8 @@ class RedisExecutor:
         Returns:
             Dictionary with execution statistics.
         """
-        total_queries = len(self.execution_history)
+        stats = self._stats
+        total_queries = stats["total"]
         if total_queries == 0:
             return {
                 "total_queries": 0,
@@ -127,27 +380,36 @@ class RedisExecutor:
                 "average_execution_time": 0
             }
         
-        successful_queries = sum(1 for info in self.execution_history.values() if info["success"])
-        failed_queries = total_queries - successful_queries
-        
-        execution_times = [
-            info["execution_time"]
-            for info in self.execution_history.values()
-            if info["success"]
-        ]
-        
         return {
             "total_queries": total_queries,
-            "successful_queries": successful_queries,
-            "failed_queries": failed_queries,
-            "success_rate": successful_queries / total_queries,
-            "average_execution_time": sum(execution_times) / len(execution_times)
-            if execution_times else 0
+            "successful_queries": stats["ok"],
+            "failed_queries": stats["fail"],
+            "success_rate": stats["ok"] / total_queries,
+            "average_execution_time": stats["time_sum"] / stats["time_n"]
+            if stats["time_n"] else 0
         }
     
     def clear_history(self) -> None:
         """Clear the execution history."""
         self.execution_history.clear()
+        self._stats = self._empty_stats()
+        self._slow.clear()
+        self._errors.clear()
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Create zeroed running execution aggregates.
+        
+        Returns:
+            Dictionary of execution counters.
+        """
+        return {
+            "total": 0,
+            "ok": 0,
+            "fail": 0,
+            "time_sum": 0.0,
+            "time_n": 0
+        }
     
     def get_error_queries(self) -> List[Dict[str, Any]]:
         """Get information about queries that failed.
@@ -155,28 +417,26 @@ class RedisExecutor:
         Returns:
             List of dictionaries containing failed query information.
         """
-        return [
-            {"query": query, "error": info["error"]}
-            for query, info in self.execution_history.items()
-            if not info["success"]
-        ]
+        return list(self._errors)
     
     def get_slow_queries(self, threshold_ms: int = 1000) -> List[Dict[str, Any]]:
         """Get information about slow queries.
         
+        Only the max_slow_queries slowest successful executions are tracked.
+        
         Args:
             threshold_ms: Execution time threshold in milliseconds.
             
         Returns:
-            List of dictionaries containing slow query information.
+            List of dictionaries containing slow query information, slowest first.
         """
         return [
             {
                 "query": query,
-                "execution_time": info["execution_time"]
+                "execution_time": execution_time
             }
-            for query, info in self.execution_history.items()
-            if info["success"] and info["execution_time"] > threshold_ms
+            for execution_time, query in sorted(self._slow, reverse=True)
+            if execution_time > threshold_ms
         ]
     
     def get_query_result(self, query: str) -> Optional[Dict[str, Any]]:
@@ -1,7 +1,21 @@
+import numpy as np
 from typing import List, Dict, Optional, Set, Tuple, Any, Union
 from ..config.dialect_config import DialectConfig
 
 
+# Execution time above which a successful query is reported as slow
+_SLOW_EXECUTION_MS = 1000  # 1 second threshold
+
+# Expectation errors for each (success, expected_valid) outcome. "{error}" is
+# replaced by the execution error message
+_EXPECTATION_ERRORS: Dict[Tuple[bool, bool], Tuple[str, ...]] = {
+    (True, True): (),
+    (True, False): ("Unexpected success",),
+    (False, True): ("Unexpected failure", "Unexpected error: {error}"),
+    (False, False): ()
+}
+
+
 class ResultValidator:
     """Validates Redis Search query execution results."""
     
@@ -12,7 +26,17 @@ class ResultValidator:
             dialect_config: Dialect configuration instance.
         """
         self.dialect_config = dialect_config
-        self.validation_history: Dict[str, Dict[str, Any]] = {}
+        
+        # Validation history stored column-wise, one row per distinct query
+        self._row_index: Dict[str, int] = {}
+        self._queries: List[str] = []
+        self._errors: List[Optional[str]] = []
+        self._validation_errors: List[List[str]] = []
+        self._expected = np.zeros(0, dtype=bool)
+        self._actual = np.zeros(0, dtype=bool)
+        self._has_errors = np.zeros(0, dtype=bool)
+        self._execution_times = np.zeros(0, dtype=np.float64)
+        self._size = 0
     
     def validate_result(self, query: str, result: Dict[str, Any], expected_valid: bool) -> Dict[str, Any]:
         """Validate a query execution result.
@@ -25,35 +49,23 @@ class ResultValidator:
         Returns:
             Dictionary containing validation results and metadata.
         """
+        success = result["success"]
+        execution_time = result.get("execution_time", 0)
+        validation_errors = _compute_errors(
+            success, expected_valid, result.get("error", "Unknown error"), execution_time
+        )
+        
         validation_info = {
             "query": query,
             "expected_valid": expected_valid,
-            "actual_valid": result["success"],
-            "execution_time": result.get("execution_time", 0),
+            "actual_valid": success,
+            "execution_time": execution_time,
             "error": result.get("error"),
-            "validation_errors": []
+            "validation_errors": validation_errors
         }
         
-        # Check if the result matches expectations
-        if expected_valid != result["success"]:
-            validation_info["validation_errors"].append(
-                f"Unexpected {'success' if result['success'] else 'failure'}"
-            )
-        
-        # Validate execution time
-        if result["success"] and result.get("execution_time", 0) > 1000:  # 1 second threshold
-            validation_info["validation_errors"].append(
-                f"Slow execution time: {result['execution_time']}ms"
-            )
-        
-        # Validate error messages for invalid queries
-        if not result["success"] and expected_valid:
-            validation_info["validation_errors"].append(
-                f"Unexpected error: {result.get('error', 'Unknown error')}"
-            )
-        
         # Record validation history
-        self.validation_history[query] = validation_info
+        self._record(self._intern(query), validation_info)
         
         return validation_info
     
@@ -71,13 +83,58 @@ class ResultValidator:
             for query, result, expected_valid in results
         ]
     
+    def _intern(self, query: str) -> int:
+        """Get the history row of a query, allocating one on first sight.
+        
+        Args:
+            query: The query to look up.
+            
+        Returns:
+            The query's row index in the history columns.
+        """
+        row = self._row_index.get(query)
+        if row is None:
+            row = self._size
+            if row == len(self._expected):
+                self._grow()
+            self._row_index[query] = row
+            self._queries.append(query)
+            self._errors.append(None)
+            self._validation_errors.append([])
+            self._size += 1
+        return row
+    
+    def _record(self, row: int, validation_info: Dict[str, Any]) -> None:
+        """Store a validation result in the history columns.
+        
+        A query validated again overwrites its previous row.
+        
+        Args:
+            row: The query's row index, as returned by _intern.
+            validation_info: The validation result to store.
+        """
+        self._errors[row] = validation_info["error"]
+        self._validation_errors[row] = validation_info["validation_errors"]
+        self._expected[row] = validation_info["expected_valid"]
+        self._actual[row] = validation_info["actual_valid"]
+        self._has_errors[row] = bool(validation_info["validation_errors"])
+        self._execution_times[row] = validation_info["execution_time"]
+    
+    def _grow(self) -> None:
+        """Double the capacity of the history arrays."""
+        extra = max(len(self._expected), 1024)
+        self._expected = np.concatenate((self._expected, np.zeros(extra, dtype=bool)))
+        self._actual = np.concatenate((self._actual, np.zeros(extra, dtype=bool)))
+        self._has_errors = np.concatenate((self._has_errors, np.zeros(extra, dtype=bool)))
+        self._execution_times = np.concatenate((self._execution_times, np.zeros(extra, dtype=np.float64)))
+    
     def get_validation_stats(self) -> Dict[str, Any]:
         """Get statistics about result validation.
         
         Returns:
             Dictionary with validation statistics.
         """
-        total_validations = len(self.validation_history)
+        total_validations = self._size
         if total_validations == 0:
             return {
                 "total_validations": 0,
@@ -86,9 +143,8 @@ class ResultValidator:
                 "match_rate": 0
             }
         
-        matching_expectations = sum(
-            1 for info in self.validation_history.values()
-            if info["expected_valid"] == info["actual_valid"]
+        matching_expectations = int(
+            (self._expected[:total_validations] == self._actual[:total_validations]).sum()
         )
         mismatching_expectations = total_validations - matching_expectations
         
@@ -101,7 +157,11 @@ class ResultValidator:
     
     def clear_history(self) -> None:
         """Clear the validation history."""
-        self.validation_history.clear()
+        self._row_index.clear()
+        self._queries.clear()
+        self._errors.clear()
+        self._validation_errors.clear()
+        self._size = 0
     
     def get_validation_errors(self) -> List[Dict[str, Any]]:
         """Get information about validation errors.
@@ -111,13 +171,12 @@ class ResultValidator:
         """
         return [
             {
-                "query": query,
-                "expected_valid": info["expected_valid"],
-                "actual_valid": info["actual_valid"],
-                "errors": info["validation_errors"]
+                "query": self._queries[row],
+                "expected_valid": bool(self._expected[row]),
+                "actual_valid": bool(self._actual[row]),
+                "errors": self._validation_errors[row]
             }
-            for query, info in self.validation_history.items()
-            if info["validation_errors"]
+            for row in np.flatnonzero(self._has_errors[:self._size]).tolist()
         ]
     
     def get_unexpected_successes(self) -> List[Dict[str, Any]]:
@@ -126,14 +185,15 @@ class ResultValidator:
         Returns:
             List of dictionaries containing unexpected success information.
         """
+        size = self._size
+        rows = np.flatnonzero(~self._expected[:size] & self._actual[:size]).tolist()
         return [
             {
-                "query": query,
-                "execution_time": info["execution_time"],
-                "error": info["error"]
+                "query": self._queries[row],
+                "execution_time": float(self._execution_times[row]),
+                "error": self._errors[row]
             }
-            for query, info in self.validation_history.items()
-            if not info["expected_valid"] and info["actual_valid"]
+            for row in rows
         ]
     
     def get_unexpected_failures(self) -> List[Dict[str, Any]]:
@@ -142,13 +202,14 @@ class ResultValidator:
         Returns:
             List of dictionaries containing unexpected failure information.
         """
+        size = self._size
+        rows = np.flatnonzero(self._expected[:size] & ~self._actual[:size]).tolist()
         return [
             {
-                "query": query,
-                "error": info["error"]
+                "query": self._queries[row],
+                "error": self._errors[row]
             }
-            for query, info in self.validation_history.items()
-            if info["expected_valid"] and not info["actual_valid"]
+            for row in rows
         ]
     
     def get_validation_result(self, query: str) -> Optional[Dict[str, Any]]:
@@ -160,4 +221,44 @@ class ResultValidator:
         Returns:
             Validation result dictionary, or None if not found.
         """
-        return self.validation_history.get(query)
+        row = self._row_index.get(query)
+        if row is None:
+            return None
+        
+        return {
+            "query": query,
+            "expected_valid": bool(self._expected[row]),
+            "actual_valid": bool(self._actual[row]),
+            "execution_time": float(self._execution_times[row]),
+            "error": self._errors[row],
+            "validation_errors": self._validation_errors[row]
+        }
+
+
+def _compute_errors(
+    success: bool,
+    expected_valid: bool,
+    error: Optional[str],
+    execution_time: float
+) -> List[str]:
+    """Compute the validation errors of a result.
+    
+    Args:
+        success: Whether the query executed successfully.
+        expected_valid: Whether the query was expected to be valid.
+        error: The execution error message.
+        execution_time: The execution time in milliseconds.
+        
+    Returns:
+        List of validation error messages.
+    """
+    errors = [
+        message.format(error=error)
+        for message in _EXPECTATION_ERRORS[bool(success), bool(expected_valid)]
+    ]
+    
+    # Validate execution time
+    if success and execution_time > _SLOW_EXECUTION_MS:
+        errors.append(f"Slow execution time: {execution_time}ms")
+    
+    return errors
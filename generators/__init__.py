@@ -1,7 +1,15 @@
 """Query generation and mutation package for the Redis Search Fuzzer."""
 
-from .query_generator import QueryGenerator
-from .mutation_engine import MutationEngine
-from .validity_controller import ValidityController
+from .._lazy import install
 
-__all__ = ["QueryGenerator", "MutationEngine", "ValidityController"]
+# Public names mapped to the submodules defining them. Submodules (and their
+# dependencies such as numpy) are imported on first access.
+_LAZY_EXPORTS = {
+    "QueryGenerator": ".query_generator",
+    "MutationEngine": ".mutation_engine",
+    "ValidityController": ".validity_controller",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
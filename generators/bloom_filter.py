@@ -0,0 +1,89 @@
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """Approximate set of strings supporting only insertion and membership tests.
+    
+    Membership tests can report false positives at roughly the configured error
+    rate once the filter holds its capacity, but never false negatives. Memory
+    use is fixed at creation time regardless of how many items are added.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """Initialize the Bloom filter.
+        
+        Args:
+            capacity: Expected number of distinct items.
+            error_rate: Target false positive rate at full capacity.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        
+        # Optimal bit count and number of hash functions for the target rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        
+        # Approximate number of distinct items added
+        self.count = 0
+    
+    def _positions(self, item: str) -> Iterator[int]:
+        """Get the bit positions of an item.
+        
+        Uses double hashing over the two halves of a single 128-bit digest.
+        
+        Args:
+            item: The item to hash.
+        
+        Returns:
+            Iterator over the item's bit positions.
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+    
+    def add(self, item: str) -> bool:
+        """Add an item to the filter.
+        
+        Args:
+            item: The item to add.
+        
+        Returns:
+            True if the item was not already (apparently) present, False otherwise.
+        """
+        bits = self._bits
+        added = False
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added.
+        
+        Args:
+            item: The item to check.
+        
+        Returns:
+            True if the item was possibly added, False if it definitely was not.
+        """
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        """Get the approximate number of distinct items added."""
+        return self.count
+    
+    def clear(self) -> None:
+        """Remove all items from the filter."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
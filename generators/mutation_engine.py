@@ -1,19 +1,83 @@
 import random
+import numpy as np
 from typing import List, Dict, Optional, Set, Tuple, Any
 from ..config.dialect_config import DialectConfig
 
 
+# Mutation choice tables
+_MUTATION_TYPES = ("syntax_error", "feature_mismatch", "parameter_error", "length_error")
+_PARAMETER_CORRUPTION_TYPES = ("invalid_type", "out_of_range", "missing_required", "extra_parameter")
+_LENGTH_ERROR_TYPES = ("too_long", "too_short", "empty")
+_BRACKETS = "()[]{}"
+_OPERATORS = "+-*/%&|^~"
+_QUOTES = "'\""
+_SYNTAX_CHARS = frozenset(_BRACKETS + _QUOTES)
+# Upper bound on the length of "too long" mutations; they only need to exceed
+# the server's query length limit, not scale with the original query
+_LENGTH_ERROR_MAX = 4096
+
+_ALL_FEATURES = frozenset({
+    "full_text", "numeric", "geo", "vector", "aggregation",
+    "wildcard", "parameterized", "dialect_specifier"
+})
+
+
 class MutationEngine:
     """Generates invalid queries by mutating valid ones."""
     
-    def __init__(self, dialect_config: DialectConfig):
+    def __init__(self, dialect_config: DialectConfig, seed: Optional[int] = None):
         """Initialize the mutation engine.
         
         Args:
             dialect_config: Dialect configuration instance.
+            seed: Seed for the engine's random number generator, for
+                reproducible mutations. If None, the generator is seeded from
+                system entropy.
         """
         self.dialect_config = dialect_config
         self.mutation_history: Dict[str, List[str]] = {}
+        
+        # Per-engine random number generator, with its methods pre-bound
+        self._rng = random.Random(seed)
+        self._choice = self._rng.choice
+        self._randrange = self._rng.randrange
+        self._randint = self._rng.randint
+        self._random = self._rng.random
+        self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        
+        # Bracket and quote positions of the most recently indexed query;
+        # mutations usually chain from the same base query
+        self._indexed_query: Optional[str] = None
+        self._syntax_points: Dict[str, List[int]] = {}
+        
+        # Dispatch tables from mutation names to their implementations
+        self._mutations = {
+            "syntax_error": self._add_syntax_error,
+            "feature_mismatch": self._create_feature_mismatch,
+            "parameter_error": self._corrupt_parameter,
+            "length_error": self._create_length_error
+        }
+        self._syntax_errors = (
+            self._missing_bracket,
+            self._extra_bracket,
+            self._invalid_operator,
+            self._missing_quote,
+            self._extra_quote
+        )
+    
+    @property
+    def rng(self) -> random.Random:
+        """The engine's seeded random number generator.
+        
+        Components drawing alongside the engine use it so that a seeded
+        engine reproduces their choices too.
+        """
+        return self._rng
+    
+    @property
+    def np_rng(self) -> np.random.Generator:
+        """The engine's seeded NumPy random number generator, derived from rng."""
+        return self._np_rng
     
     def mutate_query(self, query: str, mutation_type: Optional[str] = None) -> str:
         """Mutate a query to create an invalid version.
@@ -26,18 +90,13 @@ class MutationEngine:
             A mutated (potentially invalid) query.
         """
         if mutation_type is None:
-            mutation_type = random.choice(self._get_available_mutations())
+            mutation_type = self._choice(_MUTATION_TYPES)
         
-        if mutation_type == "syntax_error":
-            return self._add_syntax_error(query)
-        elif mutation_type == "feature_mismatch":
-            return self._create_feature_mismatch(query)
-        elif mutation_type == "parameter_error":
-            return self._corrupt_parameter(query)
-        elif mutation_type == "length_error":
-            return self._create_length_error(query)
-        else:
-            raise ValueError(f"Unknown mutation type: {mutation_type}")
+        try:
+            mutation = self._mutations[mutation_type]
+        except KeyError:
+            raise ValueError(f"Unknown mutation type: {mutation_type}") from None
+        return mutation(query)
     
     def _get_available_mutations(self) -> List[str]:
         """Get the list of available mutation types.
@@ -45,12 +104,7 @@ class MutationEngine:
         Returns:
             List of mutation type names.
         """
-        return [
-            "syntax_error",
-            "feature_mismatch",
-            "parameter_error",
-            "length_error"
-        ]
+        return list(_MUTATION_TYPES)
     
     def _add_syntax_error(self, query: str) -> str:
         """Add a syntax error to the query.
@@ -62,46 +116,108 @@ class MutationEngine:
             A query with a syntax error.
         """
         # Randomly choose a syntax error to introduce
-        error_type = random.choice([
-            "missing_bracket",
-            "extra_bracket",
-            "invalid_operator",
-            "missing_quote",
-            "extra_quote"
-        ])
-        
-        if error_type == "missing_bracket":
-            # Remove a random bracket
-            brackets = ["(", ")", "[", "]", "{", "}"]
-            bracket = random.choice(brackets)
-            return query.replace(bracket, "", 1)
-        
-        elif error_type == "extra_bracket":
-            # Add a random bracket
-            brackets = ["(", ")", "[", "]", "{", "}"]
-            bracket = random.choice(brackets)
-            pos = random.randint(0, len(query))
-            return query[:pos] + bracket + query[pos:]
-        
-        elif error_type == "invalid_operator":
-            # Replace a valid operator with an invalid one
-            operators = ["+", "-", "*", "/", "%", "&", "|", "^", "~"]
-            operator = random.choice(operators)
-            pos = random.randint(0, len(query) - 1)
-            return query[:pos] + operator + query[pos + 1:]
-        
-        elif error_type == "missing_quote":
-            # Remove a quote
-            quotes = ["'", '"']
-            quote = random.choice(quotes)
-            return query.replace(quote, "", 1)
-        
-        else:  # extra_quote
-            # Add a quote
-            quotes = ["'", '"']
-            quote = random.choice(quotes)
-            pos = random.randint(0, len(query))
-            return query[:pos] + quote + query[pos:]
+        syntax_errors = self._syntax_errors
+        return syntax_errors[self._randrange(len(syntax_errors))](query)
+    
+    def _index_syntax_points(self, query: str) -> Dict[str, List[int]]:
+        """Get the positions of each bracket and quote character in a query.
+        
+        The positions of the last indexed query are cached.
+        
+        Args:
+            query: The query to index.
+            
+        Returns:
+            Dictionary mapping bracket and quote characters to their positions.
+        """
+        if query is not self._indexed_query:
+            positions: Dict[str, List[int]] = {}
+            for i, c in enumerate(query):
+                if c in _SYNTAX_CHARS:
+                    positions.setdefault(c, []).append(i)
+            self._indexed_query = query
+            self._syntax_points = positions
+        return self._syntax_points
+    
+    def _remove_random_occurrence(self, query: str, char: str) -> str:
+        """Remove a random occurrence of a bracket or quote from a query.
+        
+        Args:
+            query: The query to mutate.
+            char: The bracket or quote character to remove.
+            
+        Returns:
+            The query without one occurrence of the character, or the query
+            unchanged if it does not contain the character.
+        """
+        positions = self._index_syntax_points(query).get(char)
+        if not positions:
+            return query
+        pos = positions[self._randrange(len(positions))]
+        return query[:pos] + query[pos + 1:]
+    
+    def _missing_bracket(self, query: str) -> str:
+        """Remove a random bracket from the query.
+        
+        Args:
+            query: The query to mutate.
+            
+        Returns:
+            The query without a random occurrence of the bracket.
+        """
+        bracket = _BRACKETS[self._randrange(len(_BRACKETS))]
+        return self._remove_random_occurrence(query, bracket)
+    
+    def _extra_bracket(self, query: str) -> str:
+        """Insert a random bracket into the query.
+        
+        Args:
+            query: The query to mutate.
+            
+        Returns:
+            The query with an extra bracket.
+        """
+        bracket = _BRACKETS[self._randrange(len(_BRACKETS))]
+        pos = self._randint(0, len(query))
+        return query[:pos] + bracket + query[pos:]
+    
+    def _invalid_operator(self, query: str) -> str:
+        """Replace a random character of the query with an operator.
+        
+        Args:
+            query: The query to mutate.
+            
+        Returns:
+            The query with an invalid operator.
+        """
+        operator = _OPERATORS[self._randrange(len(_OPERATORS))]
+        pos = self._randint(0, len(query) - 1)
+        return query[:pos] + operator + query[pos + 1:]
+    
+    def _missing_quote(self, query: str) -> str:
+        """Remove a random quote from the query.
+        
+        Args:
+            query: The query to mutate.
+            
+        Returns:
+            The query without a random occurrence of the quote.
+        """
+        quote = _QUOTES[self._randrange(len(_QUOTES))]
+        return self._remove_random_occurrence(query, quote)
+    
+    def _extra_quote(self, query: str) -> str:
+        """Insert a random quote into the query.
+        
+        Args:
+            query: The query to mutate.
+            
+        Returns:
+            The query with an extra quote.
+        """
+        quote = _QUOTES[self._randrange(len(_QUOTES))]
+        pos = self._randint(0, len(query))
+        return query[:pos] + quote + query[pos:]
     
     def _create_feature_mismatch(self, query: str) -> str:
         """Create a feature mismatch in the query.
@@ -113,12 +229,7 @@ class MutationEngine:
             A query with a feature mismatch.
         """
         # Get unsupported features for the current dialect
-        supported_features = set(self.dialect_config.get_supported_features())
-        all_features = {
-            "full_text", "numeric", "geo", "vector", "aggregation",
-            "wildcard", "parameterized", "dialect_specifier"
-        }
-        unsupported_features = all_features - supported_features
+        unsupported_features = _ALL_FEATURES.difference(self.dialect_config.get_supported_features())
         
         if not unsupported_features:
             return self._add_syntax_error(query)
@@ -137,12 +248,7 @@ class MutationEngine:
             A query with a corrupted parameter.
         """
         # Randomly choose a parameter corruption method
-        corruption_type = random.choice([
-            "invalid_type",
-            "out_of_range",
-            "missing_required",
-            "extra_parameter"
-        ])
+        corruption_type = self._choice(_PARAMETER_CORRUPTION_TYPES)
         
         # TODO: Implement parameter-specific corruptions
         # This would require knowledge of parameter types and valid ranges
@@ -158,15 +264,13 @@ class MutationEngine:
             A query with a length error.
         """
         # Randomly choose a length error to introduce
-        error_type = random.choice([
-            "too_long",
-            "too_short",
-            "empty"
-        ])
+        error_type = self._choice(_LENGTH_ERROR_TYPES)
         
         if error_type == "too_long":
-            # Make the query too long by repeating parts
-            return query * 10
+            # Make the query too long by repeating parts, up to ten times but
+            # at least twice
+            repeats = max(2, min(10, _LENGTH_ERROR_MAX // max(len(query), 1)))
+            return query * repeats
         
         elif error_type == "too_short":
             # Make the query too short by truncating
@@ -201,16 +305,17 @@ class MutationEngine:
         Returns:
             List of tuples containing (original_query, mutated_query).
         """
-        results = []
-        for query in queries:
-            if random.random() < mutation_ratio:
-                mutated = self.mutate_query(query)
-                results.append((query, mutated))
-                
-                if query not in self.mutation_history:
-                    self.mutation_history[query] = []
-                self.mutation_history[query].append(mutated)
-            else:
-                results.append((query, query))
+        # Pick the queries to mutate with one vectorized Bernoulli draw, then
+        # draw their mutation types in one call
+        to_mutate = np.flatnonzero(self._np_rng.random(len(queries)) < mutation_ratio).tolist()
+        mutation_types = self._rng.choices(_MUTATION_TYPES, k=len(to_mutate))
+        
+        results = [(query, query) for query in queries]
+        history = self.mutation_history
+        for i, mutation_type in zip(to_mutate, mutation_types):
+            query = queries[i]
+            mutated = self.mutate_query(query, mutation_type)
+            results[i] = (query, mutated)
+            history.setdefault(query, []).append(mutated)
         
         return results
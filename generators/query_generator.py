@@ -1,25 +1,90 @@
 import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional, Set, Tuple, Any
 from ..grammar.parser import GrammarParser
 from ..grammar.rule_expander import RuleExpander
 from ..config.dialect_config import DialectConfig
+from .bloom_filter import BloomFilter
+
+
+# Candidate queries expanded per refill of the validity buffers, and the
+# maximum number of unconsumed queries each buffer keeps
+_REFILL_SIZE = 64
+_MAX_BUFFERED = 4096
+
+# Rule expander of a generation worker process, built once by _init_worker
+_worker_expander: Optional[RuleExpander] = None
+
+
+def _init_worker(grammar_file: str, max_depth: int) -> None:
+    """Build the rule expander of a generation worker process.
+    
+    Args:
+        grammar_file: Path to the grammar file.
+        max_depth: Maximum depth for rule expansion.
+    """
+    global _worker_expander
+    _worker_expander = RuleExpander(GrammarParser(grammar_file), max_depth)
+
+
+def _generate_in_worker(count: int) -> List[str]:
+    """Generate random candidate queries in a worker process.
+    
+    Args:
+        count: Number of queries to generate.
+        
+    Returns:
+        List of randomly generated queries.
+    """
+    return _worker_expander.generate_random_queries(count)
 
 
 class QueryGenerator:
     """Generates Redis Search queries using grammar-based fuzzing."""
     
-    def __init__(self, grammar_file: str, dialect_config: DialectConfig, max_depth: int = 10):
+    def __init__(
+        self,
+        grammar_file: str,
+        dialect_config: DialectConfig,
+        max_depth: int = 10,
+        seed: Optional[int] = None,
+        workers: int = 1
+    ):
         """Initialize the query generator.
         
         Args:
             grammar_file: Path to the grammar file.
             dialect_config: Dialect configuration instance.
             max_depth: Maximum depth for rule expansion.
+            seed: Seed for query expansion and for shuffling mixed batches. If
+                None, the random number generators are seeded from system entropy.
+            workers: Number of worker processes expanding candidate queries for
+                batches. With more than one worker, each builds its own rule
+                expander seeded from system entropy, so batches are not
+                reproducible from seed.
         """
+        self.grammar_file = grammar_file
         self.parser = GrammarParser(grammar_file)
-        self.expander = RuleExpander(self.parser, max_depth)
+        self.expander = RuleExpander(self.parser, max_depth, seed)
         self.dialect_config = dialect_config
-        self.generated_queries: Set[str] = set()
+        
+        # Worker pool for batch generation, started on first use
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        # Generated queries are only ever added and counted, so an approximate
+        # fixed-size set is kept instead of the query strings themselves
+        self.generated_queries = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        self._total_generated = 0
+        
+        # Expanded queries not handed out yet, split by validity
+        self._valid_buffer: "deque[str]" = deque(maxlen=_MAX_BUFFERED)
+        self._invalid_buffer: "deque[str]" = deque(maxlen=_MAX_BUFFERED)
+        
+        # Per-generator random number generator, with its methods pre-bound
+        self._rng = random.Random(seed)
+        self._shuffle = self._rng.shuffle
     
     def generate_valid_query(self) -> str:
         """Generate a valid query for the current dialect.
@@ -27,11 +92,13 @@ class QueryGenerator:
         Returns:
             A valid Redis Search query.
         """
-        while True:
-            query = self.expander.generate_random_query()
-            if self._is_valid_query(query):
-                self.generated_queries.add(query)
-                return query
+        while not self._valid_buffer:
+            self._refill_buffers()
+        
+        query = self._valid_buffer.popleft()
+        self.generated_queries.add(query)
+        self._total_generated += 1
+        return query
     
     def generate_invalid_query(self) -> str:
         """Generate an invalid query for the current dialect.
@@ -39,11 +106,63 @@ class QueryGenerator:
         Returns:
             An invalid Redis Search query.
         """
-        while True:
-            query = self.expander.generate_random_query()
-            if not self._is_valid_query(query):
-                self.generated_queries.add(query)
-                return query
+        while not self._invalid_buffer:
+            self._refill_buffers()
+        
+        query = self._invalid_buffer.popleft()
+        self.generated_queries.add(query)
+        self._total_generated += 1
+        return query
+    
+    def _refill_buffers(self) -> None:
+        """Expand a batch of candidate queries and buffer them by validity."""
+        self._buffer_candidates(self.expander.generate_random_queries(_REFILL_SIZE))
+    
+    def _buffer_candidates(self, queries: List[str]) -> None:
+        """Buffer candidate queries by validity.
+        
+        Args:
+            queries: The candidate queries to classify.
+        """
+        is_valid = self._is_valid_query
+        valid_buffer = self._valid_buffer
+        invalid_buffer = self._invalid_buffer
+        
+        for query in queries:
+            if is_valid(query):
+                valid_buffer.append(query)
+            else:
+                invalid_buffer.append(query)
+    
+    def _prefill_buffers(self, count: int) -> None:
+        """Expand candidate queries for a batch in the worker processes.
+        
+        The candidates are split evenly across the workers and buffered by
+        validity. Any shortfall is made up by serial refills afterwards.
+        
+        Args:
+            count: Number of candidate queries to expand.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.grammar_file, self.expander.max_depth)
+            )
+        
+        count = min(count, _MAX_BUFFERED)
+        chunk_sizes = [
+            count // self.workers + (1 if i < count % self.workers else 0)
+            for i in range(self.workers)
+        ]
+        for queries in self._executor.map(_generate_in_worker, [size for size in chunk_sizes if size]):
+            self._buffer_candidates(queries)
+    
+    def close(self) -> None:
+        """Shut down the generation worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
     
     def generate_mixed_queries(self, count: int, valid_ratio: float = 0.7) -> List[str]:
         """Generate a mix of valid and invalid queries.
@@ -55,16 +174,34 @@ class QueryGenerator:
         Returns:
             List of generated queries.
         """
+        return [query for query, _ in self._generate_tagged_queries(count, valid_ratio)]
+    
+    def _generate_tagged_queries(self, count: int, valid_ratio: float) -> List[Tuple[str, bool]]:
+        """Generate a shuffled mix of queries tagged with their validity.
+        
+        Each query is tagged by the branch that produced it, so it never has
+        to be classified again.
+        
+        Args:
+            count: Number of queries to generate.
+            valid_ratio: Ratio of valid queries to generate.
+            
+        Returns:
+            List of tuples containing (query, is_valid).
+        """
         queries = []
         valid_count = int(count * valid_ratio)
         
+        if self.workers > 1:
+            self._prefill_buffers(count)
+        
         for _ in range(valid_count):
-            queries.append(self.generate_valid_query())
+            queries.append((self.generate_valid_query(), True))
         
         for _ in range(count - valid_count):
-            queries.append(self.generate_invalid_query())
+            queries.append((self.generate_invalid_query(), False))
         
-        random.shuffle(queries)
+        self._shuffle(queries)
         return queries
     
     def _is_valid_query(self, query: str) -> bool:
@@ -94,11 +231,23 @@ class QueryGenerator:
         # This would require mapping features to specific non-terminals in the grammar
         return None
     
-    def get_supported_features(self) -> List[str]:
-        """Get the list of supported features for the current dialect.
+    def get_symbol_features(self, symbol: str) -> Set[str]:
+        """Get the features a grammar symbol exercises in the current dialect.
+        
+        Args:
+            symbol: The grammar symbol to look up.
+            
+        Returns:
+            Set of supported features the symbol belongs to.
+        """
+        is_supported = self.dialect_config.is_feature_supported
+        return {feature for feature in self.parser.get_symbol_features(symbol) if is_supported(feature)}
+    
+    def get_supported_features(self) -> Tuple[str, ...]:
+        """Get the supported features for the current dialect.
         
         Returns:
-            List of supported features.
+            Tuple of supported features.
         """
         return self.dialect_config.get_supported_features()
     
@@ -109,8 +258,8 @@ class QueryGenerator:
             Dictionary with generation statistics.
         """
         return {
-            "total_queries": len(self.generated_queries),
-            "unique_queries": len(set(self.generated_queries)),
+            "total_queries": self._total_generated,
+            "unique_queries": self.generated_queries.count,  # Approximate
             "dialect": self.dialect_config.get_dialect_name(),
             "supported_features": self.get_supported_features(),
             "expansion_stats": self.expander.get_expansion_stats()
@@ -119,6 +268,9 @@ class QueryGenerator:
     def clear_history(self) -> None:
         """Clear the history of generated queries."""
         self.generated_queries.clear()
+        self._total_generated = 0
+        self._valid_buffer.clear()
+        self._invalid_buffer.clear()
         self.expander.clear_cache()
     
     def generate_query_batch(self, batch_size: int, valid_ratio: float = 0.7) -> List[Tuple[str, bool]]:
@@ -131,8 +283,7 @@ class QueryGenerator:
         Returns:
             List of tuples containing (query, is_valid).
         """
-        queries = self.generate_mixed_queries(batch_size, valid_ratio)
-        return [(query, self._is_valid_query(query)) for query in queries]
+        return self._generate_tagged_queries(batch_size, valid_ratio)
     
     def generate_targeted_invalid_query(self, feature: str) -> Optional[str]:
         """Generate an invalid query targeting a specific feature.
@@ -1,8 +1,15 @@
+import numpy as np
 from typing import List, Dict, Optional, Set, Tuple, Any
 from ..config.dialect_config import DialectConfig
 from .mutation_engine import MutationEngine
 
 
+# Mutated candidates drawn per missing invalid query, and the number of
+# mutation rounds attempted before returning a short batch
+_MUTATION_OVERSAMPLE = 2
+_MAX_MUTATION_ROUNDS = 10
+
+
 class ValidityController:
     """Controls the generation of valid and invalid queries."""
     
@@ -18,6 +25,11 @@ class ValidityController:
         self.valid_queries: Set[str] = set()
         self.invalid_queries: Set[str] = set()
         self.feature_coverage: Dict[str, int] = {}
+        
+        # Registered queries in registration order, so batches can take a
+        # prefix without materializing the sets
+        self._valid_queries_ordered: List[str] = []
+        self._invalid_queries_ordered: List[str] = []
     
     def validate_query(self, query: str) -> bool:
         """Validate a query against the dialect configuration.
@@ -36,7 +48,9 @@ class ValidityController:
         Args:
             query: The valid query to register.
         """
-        self.valid_queries.add(query)
+        if query not in self.valid_queries:
+            self.valid_queries.add(query)
+            self._valid_queries_ordered.append(query)
         self._update_feature_coverage(query)
     
     def register_invalid_query(self, query: str) -> None:
@@ -45,7 +59,9 @@ class ValidityController:
         Args:
             query: The invalid query to register.
         """
-        self.invalid_queries.add(query)
+        if query not in self.invalid_queries:
+            self.invalid_queries.add(query)
+            self._invalid_queries_ordered.append(query)
     
     def _update_feature_coverage(self, query: str) -> None:
         """Update feature coverage statistics for a query.
@@ -75,6 +91,8 @@ class ValidityController:
         """Clear the query history and statistics."""
         self.valid_queries.clear()
         self.invalid_queries.clear()
+        self._valid_queries_ordered.clear()
+        self._invalid_queries_ordered.clear()
         self.feature_coverage.clear()
         self.mutation_engine.clear_history()
     
@@ -91,28 +109,46 @@ class ValidityController:
         valid_count = int(batch_size * valid_ratio)
         invalid_count = batch_size - valid_count
         
-        # Generate valid queries
-        valid_queries = list(self.valid_queries)[:valid_count]
-        while len(valid_queries) < valid_count:
-            # TODO: Generate new valid queries
-            pass
+        # Take valid queries from the registered ones; the batch is short of
+        # valid queries if fewer have been registered
+        valid_queries = self._valid_queries_ordered[:valid_count]
         
         # Generate invalid queries
-        invalid_queries = list(self.invalid_queries)[:invalid_count]
-        while len(invalid_queries) < invalid_count:
-            # Generate invalid queries by mutating valid ones
-            if valid_queries:
-                original = valid_queries[0]
-                mutated = self.mutation_engine.mutate_query(original)
-                if not self.validate_query(mutated):
-                    invalid_queries.append(mutated)
-                    self.register_invalid_query(mutated)
+        invalid_queries = self._invalid_queries_ordered[:invalid_count]
+        for _ in range(_MAX_MUTATION_ROUNDS):
+            missing = invalid_count - len(invalid_queries)
+            if missing <= 0 or not valid_queries:
+                break
+            
+            # Mutate an oversampled batch of valid queries, drawn with the
+            # engine's seeded generator, and keep the mutations that turned
+            # out invalid
+            originals = self.mutation_engine.rng.choices(valid_queries, k=missing * _MUTATION_OVERSAMPLE)
+            candidates = self.mutation_engine.mutate_query_batch(originals, mutation_ratio=1.0)
+            invalid_mask = np.fromiter(
+                (not self.validate_query(mutated) for _, mutated in candidates),
+                dtype=bool,
+                count=len(candidates)
+            )
+            for index in np.flatnonzero(invalid_mask).tolist():
+                # The batch already holds every registered invalid query, so
+                # a registered mutation would be a repeat
+                mutated = candidates[index][1]
+                if mutated in self.invalid_queries:
+                    continue
+                invalid_queries.append(mutated)
+                self.register_invalid_query(mutated)
+                missing -= 1
+                if not missing:
+                    break
         
         # Combine and shuffle
-        all_queries = [(q, True) for q in valid_queries] + [(q, False) for q in invalid_queries]
-        random.shuffle(all_queries)
+        queries = valid_queries + invalid_queries
+        flags = np.zeros(len(queries), dtype=bool)
+        flags[:len(valid_queries)] = True
+        order = self.mutation_engine.np_rng.permutation(len(queries))
         
-        return all_queries
+        return list(zip([queries[i] for i in order.tolist()], flags[order].tolist()))
     
     def get_feature_coverage(self) -> Dict[str, float]:
         """Get the coverage of each feature in the generated queries.
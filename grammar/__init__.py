@@ -1,6 +1,14 @@
 """Grammar package for parsing and expanding Redis Search query grammar."""
 
-from .parser import GrammarParser
-from .rule_expander import RuleExpander
+from .._lazy import install
 
-__all__ = ["GrammarParser", "RuleExpander"]
+# Public names mapped to the submodules defining them. Submodules (and their
+# dependencies such as numpy) are imported on first access.
+_LAZY_EXPORTS = {
+    "GrammarParser": ".parser",
+    "RuleExpander": ".rule_expander",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
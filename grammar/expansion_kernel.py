@@ -0,0 +1,102 @@
+import numpy as np
+from typing import Tuple
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def expand_batch(
+    root: int,
+    count: int,
+    max_depth: int,
+    is_terminal: np.ndarray,
+    choice_counts: np.ndarray,
+    rule_offsets: np.ndarray,
+    rhs_offsets: np.ndarray,
+    rhs_flat: np.ndarray,
+    samples: np.ndarray,
+    stack_symbols: np.ndarray,
+    stack_depths: np.ndarray,
+    out_symbols: np.ndarray,
+    out_values: np.ndarray,
+    query_ends: np.ndarray
+) -> Tuple[int, int, int]:
+    """Randomly expand a batch of queries into terminal value ids.
+
+    The grammar is given in CSR form: the rules of symbol s are
+    rule_offsets[s] to rule_offsets[s + 1], and the symbols of rule r are
+    rhs_flat[rhs_offsets[r]:rhs_offsets[r + 1]]. Symbols with a single choice
+    are expanded without consuming a sample.
+
+    Args:
+        root: Id of the symbol to expand.
+        count: Number of queries to generate.
+        max_depth: Maximum expansion depth.
+        is_terminal: Whether each symbol is a terminal.
+        choice_counts: Number of values of each terminal, or rules of each non-terminal.
+        rule_offsets: Start of each symbol's rules in rhs_offsets.
+        rhs_offsets: Start of each rule's symbols in rhs_flat.
+        rhs_flat: Symbol ids of all rule bodies.
+        samples: Uniform random floats in [0, 1).
+        stack_symbols: Scratch stack of symbol ids.
+        stack_depths: Scratch stack of depths, parallel to stack_symbols.
+        out_symbols: Output terminal ids.
+        out_values: Output value indices, parallel to out_symbols.
+        query_ends: Output end offset of each query in out_symbols.
+
+    Returns:
+        Tuple of (queries completed, samples consumed, outputs written). Fewer
+        than count queries are completed if samples or output space run out.
+    """
+    pos = 0
+    n_out = 0
+    for query in range(count):
+        query_pos = pos
+        query_out = n_out
+        stack_symbols[0] = root
+        stack_depths[0] = 0
+        top = 1
+
+        while top > 0:
+            top -= 1
+            symbol = stack_symbols[top]
+            depth = stack_depths[top]
+            if depth >= max_depth:
+                continue
+
+            n = choice_counts[symbol]
+            if n == 0:
+                continue
+            if n == 1:
+                index = 0
+            else:
+                if pos >= len(samples):
+                    return query, query_pos, query_out
+                index = int(samples[pos] * n)
+                pos += 1
+
+            # Handle terminal
+            if is_terminal[symbol]:
+                if n_out >= len(out_symbols):
+                    return query, query_pos, query_out
+                out_symbols[n_out] = symbol
+                out_values[n_out] = index
+                n_out += 1
+
+            # Handle non-terminal
+            else:
+                rule = rule_offsets[symbol] + index
+                for k in range(rhs_offsets[rule + 1] - 1, rhs_offsets[rule] - 1, -1):
+                    stack_symbols[top] = rhs_flat[k]
+                    stack_depths[top] = depth + 1
+                    top += 1
+
+        query_ends[query] = n_out
+
+    return count, pos, n_out
+
+
+# Compiled variant of the kernel, or None if numba is not installed
+expand_batch_compiled = numba.njit(cache=True)(expand_batch) if numba is not None else None
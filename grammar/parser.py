@@ -1,4 +1,4 @@
-import re
+import importlib.util
 from typing import Dict, List, Set, Tuple, Optional, Any
 
 
@@ -38,24 +38,42 @@ class GrammarParser:
         self.terminals: Dict[str, List[str]] = {}
         self.non_terminals: Set[str] = set()
         self.root: Optional[str] = None
+        self.feature_mapping: Dict[str, List[str]] = {}
+        self.symbol_to_features: Dict[str, Set[str]] = {}
+        
+        # Integer symbol tables, indexed by symbol id
+        self.symbol_ids: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self.symbol_is_terminal: List[bool] = []
+        self.terminal_values_by_id: List[List[str]] = []
+        self.rhs_by_id: List[List[Tuple[int, ...]]] = []
         
         self._parse_grammar_file()
+        self._build_symbol_tables()
     
     def _parse_grammar_file(self) -> None:
-        """Parse the grammar file and extract rules and terminals."""
-        with open(self.grammar_file, 'r') as f:
-            content = f.read()
+        """Load the grammar file and extract rules and terminals.
+        
+        The grammar file is a Python module defining its rules and terminals as
+        literals, so it is executed directly rather than scanned as text.
+        
+        Raises:
+            ImportError: If the grammar file cannot be loaded.
+        """
+        spec = importlib.util.spec_from_file_location("_search_query_grammar", self.grammar_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load grammar file: {self.grammar_file}")
+        grammar = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(grammar)
         
         # Extract root symbol
-        root_match = re.search(r'root\s*=\s*"([^"]+)"', content)
-        if root_match:
-            self.root = root_match.group(1)
+        self.root = getattr(grammar, "root", None)
         
         # Extract rules
-        rule_pattern = r'"([^"]+)\s*::=\s*([^"]+)"'
-        for match in re.finditer(rule_pattern, content):
-            lhs, rhs_str = match.groups()
-            rhs = rhs_str.strip().split()
+        for rule_str in getattr(grammar, "rules", []):
+            lhs, rhs_str = rule_str.split("::=", 1)
+            lhs = lhs.strip()
+            rhs = rhs_str.split()
             
             rule = GrammarRule(lhs, rhs)
             
@@ -66,11 +84,60 @@ class GrammarParser:
             self.non_terminals.add(lhs)
         
         # Extract terminals
-        terminal_pattern = r'"([^"]+)":\s*\[(.*?)\]'
-        for match in re.finditer(terminal_pattern, content):
-            terminal_name, values_str = match.groups()
-            values = [v.strip().strip('"') for v in values_str.split(',')]
-            self.terminals[terminal_name] = values
+        for terminal_name, values in getattr(grammar, "terminals", {}).items():
+            self.terminals[terminal_name] = list(values)
+        
+        # Extract feature mapping and its reverse index, building the index
+        # for grammars that do not define one
+        self.feature_mapping = dict(getattr(grammar, "feature_mapping", {}))
+        symbol_to_features = getattr(grammar, "symbol_to_features", None)
+        if symbol_to_features is None:
+            symbol_to_features = {}
+            for feature, symbols in self.feature_mapping.items():
+                for symbol in symbols:
+                    symbol_to_features.setdefault(symbol, set()).add(feature)
+        self.symbol_to_features = symbol_to_features
+    
+    def _build_symbol_tables(self) -> None:
+        """Assign every grammar symbol an integer id and build id-indexed tables.
+        
+        Symbols used in rules but defined neither as terminals nor as rule
+        heads get an id with no values and no rules.
+        """
+        symbols = [self.root] if self.root is not None else []
+        symbols.extend(self.terminals)
+        symbols.extend(self.rules)
+        for rules in self.rules.values():
+            for rule in rules:
+                symbols.extend(rule.rhs)
+        
+        symbol_ids = self.symbol_ids
+        for symbol in symbols:
+            if symbol not in symbol_ids:
+                symbol_ids[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+        
+        for symbol in self.symbols:
+            is_terminal = symbol in self.terminals
+            self.symbol_is_terminal.append(is_terminal)
+            self.terminal_values_by_id.append(self.terminals.get(symbol, []))
+            self.rhs_by_id.append(
+                [] if is_terminal else [
+                    tuple(symbol_ids[rhs_symbol] for rhs_symbol in rule.rhs)
+                    for rule in self.rules.get(symbol, [])
+                ]
+            )
+    
+    def get_symbol_id(self, symbol: str) -> Optional[int]:
+        """Get the integer id of a symbol.
+        
+        Args:
+            symbol: The symbol to look up.
+            
+        Returns:
+            The symbol's id, or None if the symbol does not appear in the grammar.
+        """
+        return self.symbol_ids.get(symbol)
     
     def get_rules_for_non_terminal(self, non_terminal: str) -> List[GrammarRule]:
         """Get all rules for a non-terminal.
@@ -140,6 +207,17 @@ class GrammarParser:
         """
         return self.terminals.get(terminal, [])
     
+    def get_symbol_features(self, symbol: str) -> Set[str]:
+        """Get the features a symbol belongs to.
+        
+        Args:
+            symbol: The symbol to look up.
+            
+        Returns:
+            Set of feature names, empty if the symbol is not mapped to any feature.
+        """
+        return self.symbol_to_features.get(symbol, set())
+    
     def get_rule_table(self) -> Dict[str, List[List[str]]]:
         """Get a rule table for query generation.
         
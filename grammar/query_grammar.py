@@ -102,4 +102,10 @@ feature_mapping = {
     "wildcard": ["wildcard"],
     "parameterized": ["param"],
     "dialect_specifier": ["DIALECT"]
-} 
\ No newline at end of file
+} 
+
+# Reverse index of the feature mapping: the features each symbol belongs to
+symbol_to_features = {}
+for feature, symbols in feature_mapping.items():
+    for symbol in symbols:
+        symbol_to_features.setdefault(symbol, set()).add(feature)
@@ -1,22 +1,109 @@
-import random
-from typing import List, Dict, Optional, Set, Tuple
-from .parser import GrammarParser, GrammarRule
+import itertools
+import numpy as np
+from typing import Callable, Hashable, Iterable, Iterator, List, Dict, Optional, Set, Tuple, TypeVar, Union
+from .parser import GrammarParser
+from .expansion_kernel import expand_batch_compiled
+
+
+# Uniform samples drawn from NumPy at a time for random query generation
+_SAMPLE_CHUNK = 4096
+
+# Initial per-query sample and output budget of the compiled batch kernel
+_KERNEL_TOKENS_PER_QUERY = 16
+
+_T = TypeVar("_T", bound=Hashable)
+
+
+def _unique(items: Iterable[_T]) -> Iterator[_T]:
+    """Lazily drop repeated items, keeping the first occurrence of each.
+    
+    Args:
+        items: The items to filter.
+        
+    Returns:
+        Iterator over the distinct items, in order of first occurrence.
+    """
+    seen: Set[_T] = set()
+    add = seen.add
+    for item in items:
+        if item not in seen:
+            add(item)
+            yield item
+
+
+class NonTerminalInfo:
+    """Rules and memoized expansions of a single non-terminal."""
+    
+    __slots__ = ("rules", "expansion_by_depth")
+    
+    def __init__(self, rules: List[Tuple[int, ...]], max_depth: int):
+        """Initialize the non-terminal record.
+        
+        Args:
+            rules: Right-hand sides of the non-terminal's rules, as symbol ids.
+            max_depth: Maximum expansion depth, sizing the memo slots.
+        """
+        self.rules = rules
+        self.expansion_by_depth: List[Optional[List[Tuple[str, ...]]]] = [None] * max_depth
 
 
 class RuleExpander:
     """Handles the expansion of grammar rules into concrete queries."""
     
-    def __init__(self, parser: GrammarParser, max_depth: int = 10):
+    def __init__(
+        self,
+        parser: GrammarParser,
+        max_depth: int = 10,
+        seed: Optional[int] = None,
+        max_expansions: Optional[int] = None
+    ):
         """Initialize the rule expander.
         
         Args:
             parser: The grammar parser instance.
             max_depth: Maximum depth for rule expansion to prevent infinite recursion.
+            seed: Seed for random query generation. If None, the generator is
+                seeded from system entropy.
+            max_expansions: Maximum number of expansions enumerated per
+                non-terminal and rule suffix at each depth, bounding the size of
+                exhaustive expansion. If None, expansions are not capped.
         """
         self.parser = parser
         self.max_depth = max_depth
-        self.expansion_cache: Dict[str, List[str]] = {}
-        self.terminal_cache: Dict[str, List[str]] = {}
+        self.max_expansions = max_expansions
+        
+        # Symbol tables indexed by the parser's integer symbol ids
+        self._is_terminal = parser.symbol_is_terminal
+        self._terminal_values = parser.terminal_values_by_id
+        self.nt_info: List[Optional[NonTerminalInfo]] = [
+            None if is_terminal else NonTerminalInfo(rhs_list, max_depth)
+            for is_terminal, rhs_list in zip(parser.symbol_is_terminal, parser.rhs_by_id)
+        ]
+        self._rhs_cache: Dict[Tuple[Tuple[int, ...], int], List[Tuple[str, ...]]] = {}
+        
+        # Single-token expansions of each terminal, empty for non-terminals
+        self._terminal_tokens: List[List[Tuple[str, ...]]] = [
+            [(value,) for value in values] for values in self._terminal_values
+        ]
+        
+        # Random choices by symbol id as one contiguous table: the values of a
+        # terminal, or the rule bodies of a non-terminal
+        self._choices_by_id: List[Union[List[str], List[Tuple[int, ...]]]] = [
+            values if info is None else info.rules
+            for values, info in zip(self._terminal_values, self.nt_info)
+        ]
+        
+        # Stream of uniform floats in [0, 1), drawn from NumPy in chunks
+        self._np_rng = np.random.default_rng(seed)
+        self._next_sample: Callable[[], float] = itertools.chain.from_iterable(
+            iter(lambda: self._np_rng.random(_SAMPLE_CHUNK).tolist(), None)
+        ).__next__
+        
+        # Random generation functions specialized to the grammar, by symbol id
+        self._generators = self._compile_generators()
+        
+        # Grammar tables for the compiled batch kernel, when numba is available
+        self._kernel_tables = self._build_kernel_tables() if expand_batch_compiled is not None else None
     
     def expand_rule(self, non_terminal: str, depth: int = 0) -> List[str]:
         """Expand a non-terminal into a list of possible expansions.
@@ -28,74 +115,164 @@ class RuleExpander:
         Returns:
             List of possible expansions for the non-terminal.
         """
+        symbol_id = self.parser.get_symbol_id(non_terminal)
+        if symbol_id is None:
+            return []
+        return ["".join(tokens) for tokens in self._expand_tokens(symbol_id, depth)]
+    
+    def _expand_tokens(self, symbol_id: int, depth: int) -> List[Tuple[str, ...]]:
+        """Expand a non-terminal into token sequences.
+        
+        Expansions are kept as token tuples and only joined into strings by
+        the public methods, so each character is copied once. Rules that
+        produce the same token sequence are expanded to it only once.
+        
+        Args:
+            symbol_id: Id of the non-terminal to expand.
+            depth: Current expansion depth.
+            
+        Returns:
+            List of token tuples, one per possible expansion.
+        """
         if depth >= self.max_depth:
             return []
         
-        # Check cache first
-        cache_key = f"{non_terminal}_{depth}"
-        if cache_key in self.expansion_cache:
-            return self.expansion_cache[cache_key]
+        info = self.nt_info[symbol_id]
+        if info is None:
+            return []
         
-        expansions = []
-        rules = self.parser.get_rules_for_non_terminal(non_terminal)
+        # Check the memo slot first
+        expansions = info.expansion_by_depth[depth]
+        if expansions is not None:
+            return expansions
         
-        for rule in rules:
-            rule_expansions = self._expand_rule_rhs(rule.rhs, depth + 1)
-            expansions.extend(rule_expansions)
+        expand_rhs = self._expand_rule_rhs
+        child_depth = depth + 1
+        limit = self.max_expansions
+        unique_expansions: Dict[Tuple[str, ...], None] = {}
+        for rhs in info.rules:
+            unique_expansions.update(dict.fromkeys(expand_rhs(rhs, child_depth)))
+            if limit is not None and len(unique_expansions) >= limit:
+                break
+        expansions = list(itertools.islice(unique_expansions, limit))
         
         # Cache the results
-        self.expansion_cache[cache_key] = expansions
+        info.expansion_by_depth[depth] = expansions
         return expansions
     
-    def _expand_rule_rhs(self, rhs: List[str], depth: int) -> List[str]:
+    def _expand_rule_rhs(self, rhs: Tuple[int, ...], depth: int) -> List[Tuple[str, ...]]:
         """Expand the right-hand side of a rule.
         
+        Results are memoized by (rhs, depth), so suffixes shared between rules
+        are expanded only once. Products that concatenate to the same token
+        sequence are kept only once.
+        
         Args:
-            rhs: Right-hand side of the rule.
+            rhs: Right-hand side of the rule, as symbol ids.
             depth: Current expansion depth.
             
         Returns:
-            List of possible expansions for the right-hand side.
+            List of token tuples, one per possible expansion of the right-hand side.
         """
         if not rhs:
-            return [""]
+            return [()]
+        
+        rhs_cache = self._rhs_cache
+        cache_key = (rhs, depth)
+        cached = rhs_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         first_symbol = rhs[0]
-        rest_symbols = rhs[1:]
         
         # Handle terminal
-        if self.parser.is_terminal(first_symbol):
-            terminal_values = self._get_terminal_values(first_symbol)
-            rest_expansions = self._expand_rule_rhs(rest_symbols, depth)
-            
-            expansions = []
-            for value in terminal_values:
-                for rest_expansion in rest_expansions:
-                    expansions.append(f"{value}{rest_expansion}")
-            return expansions
+        if self._is_terminal[first_symbol]:
+            first_expansions = self._terminal_tokens[first_symbol]
         
         # Handle non-terminal
-        first_expansions = self.expand_rule(first_symbol, depth)
-        rest_expansions = self._expand_rule_rhs(rest_symbols, depth)
+        else:
+            first_expansions = self._expand_tokens(first_symbol, depth)
         
-        expansions = []
-        for first_expansion in first_expansions:
-            for rest_expansion in rest_expansions:
-                expansions.append(f"{first_expansion}{rest_expansion}")
+        rest_expansions = self._expand_rule_rhs(rhs[1:], depth)
+        products = (
+            first_expansion + rest_expansion
+            for first_expansion in first_expansions
+            for rest_expansion in rest_expansions
+        )
+        if self.max_expansions is None:
+            expansions = list(dict.fromkeys(products))
+        else:
+            expansions = list(itertools.islice(_unique(products), self.max_expansions))
+        
+        rhs_cache[cache_key] = expansions
         return expansions
     
-    def _get_terminal_values(self, terminal: str) -> List[str]:
-        """Get the possible values for a terminal, with caching.
+    def _iter_tokens(self, symbol_id: int, depth: int) -> Iterator[Tuple[str, ...]]:
+        """Lazily expand a non-terminal into token sequences.
+        
+        Yields the same expansions in the same order as _expand_tokens, but
+        only materializes what the caller consumes. Memoized expansions are
+        reused when available, and nothing is added to the caches.
         
         Args:
-            terminal: The terminal to get values for.
+            symbol_id: Id of the non-terminal to expand.
+            depth: Current expansion depth.
             
         Returns:
-            List of possible values for the terminal.
+            Iterator over token tuples, one per possible expansion.
         """
-        if terminal not in self.terminal_cache:
-            self.terminal_cache[terminal] = self.parser.get_terminal_values(terminal)
-        return self.terminal_cache[terminal]
+        if depth >= self.max_depth:
+            return iter(())
+        
+        info = self.nt_info[symbol_id]
+        if info is None:
+            return iter(())
+        
+        expansions = info.expansion_by_depth[depth]
+        if expansions is not None:
+            return iter(expansions)
+        
+        child_depth = depth + 1
+        lazy_expansions = _unique(itertools.chain.from_iterable(
+            self._iter_rule_rhs(rhs, child_depth) for rhs in info.rules
+        ))
+        if self.max_expansions is None:
+            return lazy_expansions
+        return itertools.islice(lazy_expansions, self.max_expansions)
+    
+    def _iter_rule_rhs(self, rhs: Tuple[int, ...], depth: int) -> Iterator[Tuple[str, ...]]:
+        """Lazily expand the right-hand side of a rule.
+        
+        Args:
+            rhs: Right-hand side of the rule, as symbol ids.
+            depth: Current expansion depth.
+            
+        Returns:
+            Iterator over token tuples, one per possible expansion of the right-hand side.
+        """
+        if not rhs:
+            return iter(((),))
+        
+        expansions = self._rhs_cache.get((rhs, depth))
+        if expansions is not None:
+            return iter(expansions)
+        
+        first_symbol = rhs[0]
+        if self._is_terminal[first_symbol]:
+            first_expansions = iter(self._terminal_tokens[first_symbol])
+        else:
+            first_expansions = self._iter_tokens(first_symbol, depth)
+        
+        # The suffix is re-expanded for each prefix instead of being held in memory
+        rest_symbols = rhs[1:]
+        products = _unique(
+            first_expansion + rest_expansion
+            for first_expansion in first_expansions
+            for rest_expansion in self._iter_rule_rhs(rest_symbols, depth)
+        )
+        if self.max_expansions is None:
+            return products
+        return itertools.islice(products, self.max_expansions)
     
     def generate_random_query(self, non_terminal: Optional[str] = None) -> str:
         """Generate a random query by expanding rules.
@@ -111,42 +288,210 @@ class RuleExpander:
             if non_terminal is None:
                 raise ValueError("No root symbol found in grammar")
         
-        return self._generate_random_expansion(non_terminal)
+        symbol_id = self.parser.get_symbol_id(non_terminal)
+        if symbol_id is None:
+            return ""
+        return self._generate_random_expansion(symbol_id)
     
-    def _generate_random_expansion(self, symbol: str, depth: int = 0) -> str:
-        """Generate a random expansion for a symbol.
+    def generate_random_queries(self, count: int, non_terminal: Optional[str] = None) -> List[str]:
+        """Generate a batch of random queries.
         
         Args:
-            symbol: The symbol to expand.
-            depth: Current expansion depth.
+            count: Number of queries to generate.
+            non_terminal: The non-terminal to start from. If None, uses the grammar root.
             
         Returns:
-            A random expansion for the symbol.
+            List of randomly generated queries.
         """
-        if depth >= self.max_depth:
-            return ""
+        if non_terminal is None:
+            non_terminal = self.parser.get_root()
+            if non_terminal is None:
+                raise ValueError("No root symbol found in grammar")
         
-        # Handle terminal
-        if self.parser.is_terminal(symbol):
-            values = self._get_terminal_values(symbol)
-            return random.choice(values)
+        symbol_id = self.parser.get_symbol_id(non_terminal)
+        if symbol_id is None:
+            return [""] * count
         
-        # Handle non-terminal
-        rules = self.parser.get_rules_for_non_terminal(symbol)
-        if not rules:
-            return ""
+        if self._kernel_tables is not None:
+            return self._generate_batch_compiled(symbol_id, count)
+        
+        generate = self._generate_random_expansion
+        return [generate(symbol_id) for _ in range(count)]
+    
+    def _build_kernel_tables(self) -> Dict[str, np.ndarray]:
+        """Flatten the grammar into the CSR arrays used by the batch kernel.
+        
+        Returns:
+            Dictionary of kernel arrays keyed by kernel argument name.
+        """
+        is_terminal = np.array(self._is_terminal, dtype=np.bool_)
+        choice_counts = np.array([len(choices) for choices in self._choices_by_id], dtype=np.int64)
+        
+        rule_offsets = [0]
+        rhs_offsets = [0]
+        rhs_flat: List[int] = []
+        for symbol_id, choices in enumerate(self._choices_by_id):
+            if not self._is_terminal[symbol_id]:
+                for rhs in choices:
+                    rhs_flat.extend(rhs)
+                    rhs_offsets.append(len(rhs_flat))
+            rule_offsets.append(len(rhs_offsets) - 1)
+        
+        max_rhs = max(np.diff(rhs_offsets), default=0)
+        return {
+            "is_terminal": is_terminal,
+            "choice_counts": choice_counts,
+            "rule_offsets": np.array(rule_offsets, dtype=np.int64),
+            "rhs_offsets": np.array(rhs_offsets, dtype=np.int64),
+            "rhs_flat": np.array(rhs_flat, dtype=np.int64),
+            "stack_symbols": np.empty(self.max_depth * max(max_rhs, 1) + 1, dtype=np.int64),
+            "stack_depths": np.empty(self.max_depth * max(max_rhs, 1) + 1, dtype=np.int64)
+        }
+    
+    def _generate_batch_compiled(self, symbol_id: int, count: int) -> List[str]:
+        """Generate a batch of random queries with the compiled kernel.
+        
+        The kernel emits (terminal id, value index) pairs; they are resolved to
+        strings and joined per query here.
+        
+        Args:
+            symbol_id: Id of the symbol to expand.
+            count: Number of queries to generate.
+            
+        Returns:
+            List of randomly generated queries.
+        """
+        tables = self._kernel_tables
+        values_by_id = self._choices_by_id
+        per_query = _KERNEL_TOKENS_PER_QUERY
+        queries: List[str] = []
+        
+        while len(queries) < count:
+            remaining = count - len(queries)
+            size = remaining * per_query
+            out_symbols = np.empty(size, dtype=np.int64)
+            out_values = np.empty(size, dtype=np.int64)
+            query_ends = np.empty(remaining, dtype=np.int64)
+            
+            done, _, n_out = expand_batch_compiled(
+                symbol_id, remaining, self.max_depth,
+                tables["is_terminal"], tables["choice_counts"], tables["rule_offsets"],
+                tables["rhs_offsets"], tables["rhs_flat"],
+                self._np_rng.random(size),
+                tables["stack_symbols"], tables["stack_depths"],
+                out_symbols, out_values, query_ends
+            )
+            
+            # Give the next round more room if a single query did not fit
+            if done == 0:
+                per_query *= 2
+                continue
+            
+            tokens = [
+                values_by_id[symbol][value]
+                for symbol, value in zip(out_symbols[:n_out].tolist(), out_values[:n_out].tolist())
+            ]
+            start = 0
+            for end in query_ends[:done].tolist():
+                queries.append("".join(tokens[start:end]))
+                start = end
+        
+        return queries
+    
+    def _compile_generators(self) -> List[Optional[Callable[[List[str], int], None]]]:
+        """Compile the grammar into one random generation function per symbol.
         
-        rule = random.choice(rules)
-        expansion = ""
+        Each symbol gets a function g<id>(out, depth) appending a random
+        expansion to out. A non-terminal's function picks one of its rules,
+        each compiled to a function r<id>_<n> that calls its symbols' functions
+        directly, with terminal values appended inline. The grammar tables
+        and max_depth are baked into the generated code, and symbols with a
+        single choice take it without drawing a sample.
         
-        for rhs_symbol in rule.rhs:
-            expansion += self._generate_random_expansion(rhs_symbol, depth + 1)
+        Returns:
+            List of generation functions by symbol id, None for symbols
+            without any expansion.
+        """
+        is_terminal = self._is_terminal
+        choices_by_id = self._choices_by_id
+        namespace: Dict[str, object] = {"_next": self._next_sample, "MAX": self.max_depth}
+        lines = []
         
-        return expansion
+        for symbol_id, choices in enumerate(choices_by_id):
+            if not choices:
+                continue
+            
+            if is_terminal[symbol_id]:
+                namespace[f"V{symbol_id}"] = tuple(choices)
+                lines.append(f"def g{symbol_id}(out, d):")
+                lines.append(f"    {self._terminal_source(symbol_id)}")
+                continue
+            
+            rule_names = []
+            for rule_index, rhs in enumerate(choices):
+                rule_name = f"r{symbol_id}_{rule_index}"
+                rule_names.append(rule_name)
+                
+                # Children at or beyond the depth limit expand to nothing
+                lines.append(f"def {rule_name}(out, d):")
+                lines.append("    if d >= MAX:")
+                lines.append("        return")
+                for rhs_symbol in rhs:
+                    rhs_choices = choices_by_id[rhs_symbol]
+                    if not rhs_choices:
+                        continue
+                    if is_terminal[rhs_symbol]:
+                        lines.append(f"    {self._terminal_source(rhs_symbol)}")
+                    else:
+                        lines.append(f"    g{rhs_symbol}(out, d)")
+            
+            lines.append(f"def g{symbol_id}(out, d):")
+            if len(rule_names) == 1:
+                lines.append(f"    {rule_names[0]}(out, d + 1)")
+            else:
+                lines.append(f"    R{symbol_id}[int(_next() * {len(choices)})](out, d + 1)")
+                lines.append(f"R{symbol_id} = ({', '.join(rule_names)},)")
+        
+        exec(compile("\n".join(lines), "<grammar>", "exec"), namespace)
+        return [namespace.get(f"g{symbol_id}") for symbol_id in range(len(choices_by_id))]
+    
+    def _terminal_source(self, symbol_id: int) -> str:
+        """Get the generated statement appending a random value of a terminal.
+        
+        Args:
+            symbol_id: Id of the terminal.
+            
+        Returns:
+            Python source appending a value to out. Terminals with a single
+            value append it as a literal without drawing a sample.
+        """
+        values = self._choices_by_id[symbol_id]
+        if len(values) == 1:
+            return f"out.append({values[0]!r})"
+        return f"out.append(V{symbol_id}[int(_next() * {len(values)})])"
+    
+    def _generate_random_expansion(self, symbol_id: int) -> str:
+        """Generate a random expansion for a symbol.
+        
+        Args:
+            symbol_id: Id of the symbol to expand.
+            
+        Returns:
+            A random expansion for the symbol.
+        """
+        generator = self._generators[symbol_id]
+        if generator is None or self.max_depth <= 0:
+            return ""
+        
+        fragments: List[str] = []
+        generator(fragments, 0)
+        return "".join(fragments)
     
     def get_all_possible_queries(self, non_terminal: Optional[str] = None, max_queries: int = 1000) -> List[str]:
         """Get all possible queries up to a maximum number.
         
+        Expansions are enumerated lazily, so only the first max_queries are built.
+        
         Args:
             non_terminal: The non-terminal to start from. If None, uses the grammar root.
             max_queries: Maximum number of queries to generate.
@@ -159,22 +504,34 @@ class RuleExpander:
             if non_terminal is None:
                 raise ValueError("No root symbol found in grammar")
         
-        queries = self.expand_rule(non_terminal)
-        return queries[:max_queries]
+        symbol_id = self.parser.get_symbol_id(non_terminal)
+        if symbol_id is None:
+            return []
+        
+        expansions = self._iter_tokens(symbol_id, 0)
+        return ["".join(tokens) for tokens in itertools.islice(expansions, max_queries)]
     
     def clear_cache(self) -> None:
-        """Clear the expansion and terminal caches."""
-        self.expansion_cache.clear()
-        self.terminal_cache.clear()
+        """Clear the expansion caches."""
+        for info in self.nt_info:
+            if info is not None:
+                info.expansion_by_depth = [None] * self.max_depth
+        self._rhs_cache.clear()
     
-    def get_expansion_stats(self) -> Dict[str, int]:
+    def get_expansion_stats(self) -> Dict[str, Optional[int]]:
         """Get statistics about rule expansions.
         
         Returns:
             Dictionary with expansion statistics.
         """
         return {
-            "cached_expansions": len(self.expansion_cache),
-            "cached_terminals": len(self.terminal_cache),
-            "max_depth": self.max_depth
+            "cached_expansions": sum(
+                expansions is not None
+                for info in self.nt_info
+                if info is not None
+                for expansions in info.expansion_by_depth
+            ),
+            "cached_rhs_expansions": len(self._rhs_cache),
+            "max_depth": self.max_depth,
+            "max_expansions": self.max_expansions
         }
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 
 from config.fuzzer_config import FuzzerConfig
+from config.dialect_config import DialectConfig
 from grammar.parser import GrammarParser
 from grammar.rule_expander import RuleExpander
 from generators.query_generator import QueryGenerator
@@ -38,6 +39,9 @@ class RedisSearchFuzzer:
     def _init_components(self) -> None:
         """Initialize all fuzzer components."""
         try:
+            # Initialize dialect configuration
+            dialect_config = DialectConfig.get(self.config.get_dialect_versions()[0])
+            
             # Initialize grammar components
             self.parser = GrammarParser("grammar/query_grammar.py")
             self.expander = RuleExpander(self.parser, self.config.get("max_generation_depth"))
@@ -45,18 +49,19 @@ class RedisSearchFuzzer:
             # Initialize generators
             self.query_generator = QueryGenerator(
                 "grammar/query_grammar.py",
-                self.config.get("dialect_config"),
-                self.config.get("max_generation_depth")
+                dialect_config,
+                self.config.get("max_generation_depth"),
+                workers=self.config.get("generation_workers", 1)
             )
-            self.mutation_engine = MutationEngine(self.config.get("dialect_config"))
+            self.mutation_engine = MutationEngine(dialect_config)
             self.validity_controller = ValidityController(
-                self.config.get("dialect_config"),
+                dialect_config,
                 self.mutation_engine
             )
             
             # Initialize execution components
             self.executor = RedisExecutor(self.config)
-            self.validator = ResultValidator(self.config.get("dialect_config"))
+            self.validator = ResultValidator(dialect_config)
             
             # Initialize reporting
             self.report_generator = ReportGenerator()
@@ -86,8 +91,11 @@ class RedisSearchFuzzer:
             # Validate results
             validation_results = self.validator.validate_result_batch(results)
             
+            # Stop monitoring before the report threads read its history
+            await self.monitor.stop_monitoring()
+            
             # Generate reports
-            self._generate_reports()
+            await self._generate_reports()
             
         except Exception as e:
             self.error_logger.log_error(
@@ -97,31 +105,45 @@ class RedisSearchFuzzer:
             raise
         
         finally:
-            # Stop monitoring
+            # Stop monitoring if a step above failed before it was stopped
             await self.monitor.stop_monitoring()
+            
+            # Stop generation workers, report writers and Redis connections
+            self.query_generator.close()
+            self.report_generator.close()
+            await self.executor.aclose()
     
-    def _generate_reports(self) -> None:
-        """Generate all fuzzer reports."""
+    async def _generate_reports(self) -> None:
+        """Generate all fuzzer reports.
+        
+        The reports are written concurrently in worker threads, so report
+        serialization does not block the event loop.
+        """
         try:
-            # Generate main report
-            self.report_generator.generate_report(
-                monitor=self.monitor,
-                executor=self.executor,
-                validator=self.validator,
-                error_logger=self.error_logger,
-                config=self.config.get_all()
-            )
-            
-            # Generate feature report
-            self.report_generator.generate_feature_report(
-                validator=self.validator,
-                error_logger=self.error_logger
-            )
-            
-            # Generate performance report
-            self.report_generator.generate_performance_report(
-                monitor=self.monitor,
-                executor=self.executor
+            await asyncio.gather(
+                # Generate main report
+                asyncio.to_thread(
+                    self.report_generator.generate_report,
+                    monitor=self.monitor,
+                    executor=self.executor,
+                    validator=self.validator,
+                    error_logger=self.error_logger,
+                    config=self.config.get_all()
+                ),
+                
+                # Generate feature report
+                asyncio.to_thread(
+                    self.report_generator.generate_feature_report,
+                    validator=self.validator,
+                    error_logger=self.error_logger
+                ),
+                
+                # Generate performance report
+                asyncio.to_thread(
+                    self.report_generator.generate_performance_report,
+                    monitor=self.monitor,
+                    executor=self.executor
+                )
             )
             
         except Exception as e:
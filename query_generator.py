@@ -131,7 +131,10 @@ terminals = {
 
 }
 
-import numpy as np
+# Terminal values are constant: freeze them, with their lengths for samplers
+terminals = {k: tuple(v) for k, v in terminals.items()}
+terminal_lens = {k: len(v) for k, v in terminals.items()}
+
 import random
 
 def generate_rule_table(rules):
@@ -146,11 +149,14 @@ def generate_rule_table(rules):
 
 if __name__ == "__main__":
     rule_table = generate_rule_table(rules)
-    query = [root]
-    while np.any([x in rule_table for x in query]):
-        for i, x in enumerate(query):
-            if x in rule_table:
-                query.pop(i)
-                query = query[:i] + random.choice(rule_table[x]) + query[i:]
-                break
-    print(" ".join([terminals[x][0] if x in terminals else x for x in query]))
+    # Expand the leftmost symbol first: symbols still to expand are kept on a
+    # stack with the leftmost on top, and output is only ever appended
+    stack = [root]
+    query = []
+    while stack:
+        x = stack.pop()
+        if x in rule_table:
+            stack.extend(reversed(random.choice(rule_table[x])))
+        else:
+            query.append(terminals[x][0] if x in terminals else x)
+    print(" ".join(query))
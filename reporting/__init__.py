@@ -1,6 +1,15 @@
 """Reporting package for logging and generating fuzzer reports."""
 
-from .error_logger import ErrorLogger
-from .report_generator import ReportGenerator
+from .._lazy import install
 
-__all__ = ["ErrorLogger", "ReportGenerator"]
+# Public names mapped to the submodules defining them. Submodules (and their
+# dependencies such as orjson) are imported on first access.
+_LAZY_EXPORTS = {
+    "ErrorLogger": ".error_logger",
+    "LogEntry": ".error_logger",
+    "ReportGenerator": ".report_generator",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = install(globals(), _LAZY_EXPORTS)
@@ -1,18 +1,88 @@
-import json
+import itertools
 import logging
-from datetime import datetime
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Set, Tuple, Any, Union
 from pathlib import Path
+from .serialization import write_report
+from .timestamps import file_timestamp, iso_now
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Log formatter that formats the date and time once per second.
+    
+    Records within the same second reuse the formatted seconds part, and only
+    the milliseconds are formatted per record.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None):
+        """Initialize the formatter.
+        
+        Args:
+            fmt: Log record format string.
+        """
+        super().__init__(fmt)
+        self._cached_time: Tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the creation time of a record.
+        
+        Args:
+            record: The log record.
+            datefmt: Explicit date format. If given, the time is formatted
+                without caching.
+            
+        Returns:
+            The formatted creation time.
+        """
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+@dataclass
+class LogEntry:
+    """A logged error, warning or crash."""
+    
+    __slots__ = ("timestamp", "type", "message", "details")
+    
+    timestamp: str
+    type: str
+    message: str
+    details: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the entry as a dictionary.
+        
+        Returns:
+            Dictionary with the entry's timestamp, type, message and details.
+        """
+        return {
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "message": self.message,
+            "details": self.details
+        }
 
 
 class ErrorLogger:
     """Handles logging of errors and issues during fuzzing."""
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", max_history: Optional[int] = 100_000):
         """Initialize the error logger.
         
         Args:
             log_dir: Directory to store log files.
+            max_history: Maximum number of errors, warnings and crashes each
+                retained, oldest dropped first. Type counts and totals still
+                cover every logged entry. If None, the history is unbounded.
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -25,29 +95,52 @@ class ErrorLogger:
         self._setup_handlers()
         
         # Initialize error tracking
-        self.errors: List[Dict[str, Any]] = []
-        self.warnings: List[Dict[str, Any]] = []
-        self.crashes: List[Dict[str, Any]] = []
+        self.max_history = max_history
+        self.errors: "deque[LogEntry]" = deque(maxlen=max_history)
+        self.warnings: "deque[LogEntry]" = deque(maxlen=max_history)
+        self.crashes: "deque[LogEntry]" = deque(maxlen=max_history)
+        
+        # Running counts of each entry type, updated as entries are logged
+        self._error_type_counts: "Counter[str]" = Counter()
+        self._warning_type_counts: "Counter[str]" = Counter()
+        self._crash_type_counts: "Counter[str]" = Counter()
+        
+        # Errors indexed by the feature named in their details, each bounded
+        # like the error history
+        self.feature_errors: "Dict[str, deque[LogEntry]]" = defaultdict(
+            lambda: deque(maxlen=max_history)
+        )
+        
+        # Summary of the logged entries, or None if an entry was logged since
+        # it was built
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        
+        # Per-kind history, type counts, log method, message prefix and
+        # details label, looked up once per logged entry
+        self._sinks: Dict[str, Tuple[Any, ...]] = {
+            "error": (self.errors, self._error_type_counts, self.logger.error, "", "Error"),
+            "warning": (self.warnings, self._warning_type_counts, self.logger.warning, "", "Warning"),
+            "crash": (self.crashes, self._crash_type_counts, self.logger.critical, "CRASH - ", "Crash")
+        }
     
     def _setup_handlers(self) -> None:
         """Set up logging handlers."""
+        # Both handlers share one formatter and its cached time
+        log_format = _CachedTimeFormatter(
+            "%(asctime)s - %(levelname)s - %(message)s"
+        )
+        
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
-        )
-        console_handler.setFormatter(console_format)
+        console_handler.setFormatter(log_format)
         self.logger.addHandler(console_handler)
         
         # File handler
-        log_file = self.log_dir / f"fuzzer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        log_file = self.log_dir / f"fuzzer_{file_timestamp()}.log"
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(file_format)
+        file_handler.setFormatter(log_format)
         self.logger.addHandler(file_handler)
     
     def log_error(self, error_type: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
@@ -58,18 +151,11 @@ class ErrorLogger:
             message: Error message.
             details: Additional error details.
         """
-        error_info = {
-            "timestamp": datetime.now().isoformat(),
-            "type": error_type,
-            "message": message,
-            "details": details or {}
-        }
-        
-        self.errors.append(error_info)
-        self.logger.error(f"{error_type}: {message}")
+        entry = self._log("error", error_type, message, details)
         
-        if details:
-            self.logger.debug(f"Error details: {json.dumps(details, indent=2)}")
+        feature = details.get("feature") if details else None
+        if feature is not None:
+            self.feature_errors[feature].append(entry)
     
     def log_warning(self, warning_type: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Log a warning.
@@ -79,18 +165,7 @@ class ErrorLogger:
             message: Warning message.
             details: Additional warning details.
         """
-        warning_info = {
-            "timestamp": datetime.now().isoformat(),
-            "type": warning_type,
-            "message": message,
-            "details": details or {}
-        }
-        
-        self.warnings.append(warning_info)
-        self.logger.warning(f"{warning_type}: {message}")
-        
-        if details:
-            self.logger.debug(f"Warning details: {json.dumps(details, indent=2)}")
+        self._log("warning", warning_type, message, details)
     
     def log_crash(self, crash_type: str, message: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Log a crash.
@@ -100,48 +175,53 @@ class ErrorLogger:
             message: Crash message.
             details: Additional crash details.
         """
-        crash_info = {
-            "timestamp": datetime.now().isoformat(),
-            "type": crash_type,
-            "message": message,
-            "details": details or {}
-        }
+        self._log("crash", crash_type, message, details)
+    
+    def _log(self, kind: str, entry_type: str, message: str, details: Optional[Dict[str, Any]]) -> LogEntry:
+        """Record and emit a log entry of the given kind.
         
-        self.crashes.append(crash_info)
-        self.logger.critical(f"CRASH - {crash_type}: {message}")
+        Args:
+            kind: Kind of entry, one of "error", "warning" and "crash".
+            entry_type: Type of the entry.
+            message: Entry message.
+            details: Additional entry details.
+            
+        Returns:
+            The recorded entry.
+        """
+        entries, type_counts, emit, prefix, details_label = self._sinks[kind]
+        entry = LogEntry(iso_now(), entry_type, message, details or {})
+        
+        entries.append(entry)
+        type_counts[entry_type] += 1
+        self._summary_cache = None
+        emit(f"{prefix}{entry_type}: {message}")
         
+        # The details are only formatted if a debug record is emitted
         if details:
-            self.logger.debug(f"Crash details: {json.dumps(details, indent=2)}")
+            self.logger.debug("%s details: %r", details_label, details)
+        
+        return entry
     
     def get_error_summary(self) -> Dict[str, Any]:
         """Get a summary of logged errors.
         
-        Returns:
-            Dictionary containing error summary.
-        """
-        return {
-            "total_errors": len(self.errors),
-            "total_warnings": len(self.warnings),
-            "total_crashes": len(self.crashes),
-            "error_types": self._count_types(self.errors),
-            "warning_types": self._count_types(self.warnings),
-            "crash_types": self._count_types(self.crashes)
-        }
-    
-    def _count_types(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Count occurrences of each type in a list of items.
+        The summary is rebuilt only after new entries are logged, so repeated
+        calls return the same dictionary, which must not be modified.
         
-        Args:
-            items: List of items to count.
-            
         Returns:
-            Dictionary mapping types to counts.
+            Dictionary containing error summary.
         """
-        type_counts = {}
-        for item in items:
-            error_type = item["type"]
-            type_counts[error_type] = type_counts.get(error_type, 0) + 1
-        return type_counts
+        if self._summary_cache is None:
+            self._summary_cache = {
+                "total_errors": sum(self._error_type_counts.values()),
+                "total_warnings": sum(self._warning_type_counts.values()),
+                "total_crashes": sum(self._crash_type_counts.values()),
+                "error_types": dict(self._error_type_counts),
+                "warning_types": dict(self._warning_type_counts),
+                "crash_types": dict(self._crash_type_counts)
+            }
+        return self._summary_cache
     
     def get_errors_by_type(self, error_type: str) -> List[Dict[str, Any]]:
         """Get all errors of a specific type.
@@ -152,7 +232,7 @@ class ErrorLogger:
         Returns:
             List of error dictionaries.
         """
-        return [e for e in self.errors if e["type"] == error_type]
+        return [e.to_dict() for e in self.errors if e.type == error_type]
     
     def get_warnings_by_type(self, warning_type: str) -> List[Dict[str, Any]]:
         """Get all warnings of a specific type.
@@ -163,7 +243,7 @@ class ErrorLogger:
         Returns:
             List of warning dictionaries.
         """
-        return [w for w in self.warnings if w["type"] == warning_type]
+        return [w.to_dict() for w in self.warnings if w.type == warning_type]
     
     def get_crashes_by_type(self, crash_type: str) -> List[Dict[str, Any]]:
         """Get all crashes of a specific type.
@@ -174,32 +254,33 @@ class ErrorLogger:
         Returns:
             List of crash dictionaries.
         """
-        return [c for c in self.crashes if c["type"] == crash_type]
+        return [c.to_dict() for c in self.crashes if c.type == crash_type]
     
-    def save_error_report(self, filename: Optional[str] = None) -> str:
+    def save_error_report(self, filename: Optional[str] = None, human_readable: bool = True) -> str:
         """Save error report to a file.
         
         Args:
             filename: Name of the report file. If None, a timestamp-based name is used.
+            human_readable: Whether to write indented JSON. If False, the report
+                is written as MessagePack with a ".msgpack" suffix instead.
             
         Returns:
             Path to the saved report file.
         """
         if filename is None:
-            filename = f"error_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"error_report_{file_timestamp()}.json"
         
         report_path = self.log_dir / filename
         
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "summary": self.get_error_summary(),
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "crashes": self.crashes
+            "errors": [entry.to_dict() for entry in self.errors],
+            "warnings": [entry.to_dict() for entry in self.warnings],
+            "crashes": [entry.to_dict() for entry in self.crashes]
         }
         
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        report_path = write_report(report_path, report, human_readable)
         
         return str(report_path)
     
@@ -208,21 +289,25 @@ class ErrorLogger:
         self.errors.clear()
         self.warnings.clear()
         self.crashes.clear()
+        self._error_type_counts.clear()
+        self._warning_type_counts.clear()
+        self._crash_type_counts.clear()
+        self.feature_errors.clear()
+        self._summary_cache = None
     
     def get_recent_errors(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent errors.
         
+        Errors are appended in timestamp order, so the most recent
+        ones are the tail of the history and no sort is needed.
+        
         Args:
             limit: Maximum number of errors to return.
             
         Returns:
             List of recent error dictionaries.
         """
-        return sorted(
-            self.errors,
-            key=lambda x: x["timestamp"],
-            reverse=True
-        )[:limit]
+        return [entry.to_dict() for entry in itertools.islice(reversed(self.errors), max(limit, 0))]
     
     def get_recent_warnings(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent warnings.
@@ -233,11 +318,7 @@ class ErrorLogger:
         Returns:
             List of recent warning dictionaries.
         """
-        return sorted(
-            self.warnings,
-            key=lambda x: x["timestamp"],
-            reverse=True
-        )[:limit]
+        return [entry.to_dict() for entry in itertools.islice(reversed(self.warnings), max(limit, 0))]
     
     def get_recent_crashes(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent crashes.
@@ -248,8 +329,4 @@ class ErrorLogger:
         Returns:
             List of recent crash dictionaries.
         """
-        return sorted(
-            self.crashes,
-            key=lambda x: x["timestamp"],
-            reverse=True
-        )[:limit]
+        return [entry.to_dict() for entry in itertools.islice(reversed(self.crashes), max(limit, 0))]
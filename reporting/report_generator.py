@@ -1,25 +1,139 @@
-import json
-import yaml
-from datetime import datetime
+import html
+import string
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Set, Tuple, Any, Union
 from ..execution.monitor import FuzzerMonitor
 from ..execution.redis_executor import RedisExecutor
 from ..execution.result_validator import ResultValidator
 from .error_logger import ErrorLogger
+from .serialization import write_report
+from .timestamps import file_timestamp, iso_now
+
+
+# Bound formatters for the rows of the HTML report tables
+_FEATURE_COVERAGE_ROW = "<tr><td>{}</td><td>{:.2%}</td></tr>".format
+_VALIDATION_ERROR_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>".format
+_SLOW_QUERY_ROW = "<tr><td>{}</td><td>{}</td></tr>".format
+_RESOURCE_WARNING_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td></tr>".format
+
+# Output formats of the main report
+_REPORT_FORMATS = frozenset({"json", "html"})
+
+# Page layout of the HTML report, with ${...} placeholders for the report data
+_HTML_TEMPLATE = string.Template(textwrap.dedent("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Redis Search Fuzzer Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .section { margin-bottom: 20px; }
+                .section h2 { color: #333; }
+                .summary { background-color: #f5f5f5; padding: 15px; border-radius: 5px; }
+                .error { color: #d32f2f; }
+                .warning { color: #f57c00; }
+                .success { color: #388e3c; }
+                table { border-collapse: collapse; width: 100%; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #f5f5f5; }
+                tr:nth-child(even) { background-color: #f9f9f9; }
+            </style>
+        </head>
+        <body>
+            <h1>Redis Search Fuzzer Report</h1>
+            <p>Generated at: ${timestamp}</p>
+            
+            <div class="section">
+                <h2>Summary</h2>
+                <div class="summary">
+                    <p>Total Queries: ${total_queries}</p>
+                    <p>Success Rate: ${success_rate}</p>
+                    <p>Validation Match Rate: ${validation_match_rate}</p>
+                    <p>Total Errors: ${total_errors}</p>
+                    <p>Total Warnings: ${total_warnings}</p>
+                    <p>Total Crashes: ${total_crashes}</p>
+                    <p>Total Execution Time: ${total_time} seconds</p>
+                    <p>Average CPU Usage: ${avg_cpu}%</p>
+                    <p>Average Memory Usage: ${avg_memory}%</p>
+                    <p>Maximum Memory Usage: ${max_memory} bytes</p>
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>Feature Coverage</h2>
+                <table>
+                    <tr>
+                        <th>Feature</th>
+                        <th>Coverage</th>
+                    </tr>
+                    ${feature_coverage_rows}
+                </table>
+            </div>
+            
+            <div class="section">
+                <h2>Validation Errors</h2>
+                <table>
+                    <tr>
+                        <th>Query</th>
+                        <th>Expected</th>
+                        <th>Actual</th>
+                        <th>Errors</th>
+                    </tr>
+                    ${validation_error_rows}
+                </table>
+            </div>
+            
+            <div class="section">
+                <h2>Slow Queries</h2>
+                <table>
+                    <tr>
+                        <th>Query</th>
+                        <th>Execution Time (ms)</th>
+                    </tr>
+                    ${slow_query_rows}
+                </table>
+            </div>
+            
+            <div class="section">
+                <h2>Resource Warnings</h2>
+                <table>
+                    <tr>
+                        <th>Type</th>
+                        <th>Value</th>
+                        <th>Threshold</th>
+                    </tr>
+                    ${resource_warning_rows}
+                </table>
+            </div>
+        </body>
+        </html>
+"""))
 
 
 class ReportGenerator:
     """Generates comprehensive reports of fuzzing results."""
     
-    def __init__(self, output_dir: str = "reports"):
+    def __init__(self, output_dir: str = "reports", human_readable: bool = True):
         """Initialize the report generator.
         
         Args:
             output_dir: Directory to store report files.
+            human_readable: Whether to write report data as indented JSON. If
+                False, it is written as MessagePack instead, which requires the
+                msgpack package. HTML reports are unaffected.
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.human_readable = human_readable
+        
+        # Writes report data while the HTML version is being rendered
+        self._write_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-writer")
+    
+    def close(self) -> None:
+        """Shut down the report writer threads, waiting for pending writes."""
+        self._write_pool.shutdown(wait=True)
     
     def generate_report(
         self,
@@ -27,7 +141,8 @@ class ReportGenerator:
         executor: RedisExecutor,
         validator: ResultValidator,
         error_logger: ErrorLogger,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        formats: Set[str] = _REPORT_FORMATS
     ) -> str:
         """Generate a comprehensive fuzzing report.
         
@@ -37,12 +152,23 @@ class ReportGenerator:
             validator: Result validator instance.
             error_logger: Error logger instance.
             config: Fuzzer configuration.
+            formats: Output formats to write, any of "json" (the report data,
+                in the format chosen by human_readable) and "html". Writing
+                only the HTML report skips serializing the report data.
             
         Returns:
-            Path to the generated report file.
+            Path to the generated HTML report, or to the report data file if
+            no HTML report is written.
+            
+        Raises:
+            ValueError: If formats is empty or contains an unknown format.
         """
+        unknown_formats = set(formats) - _REPORT_FORMATS
+        if unknown_formats or not formats:
+            raise ValueError(f"Invalid report formats: {sorted(formats)}")
+        
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "configuration": config,
             "summary": self._generate_summary(
                 monitor, executor, validator, error_logger
@@ -59,15 +185,21 @@ class ReportGenerator:
             "resource_warnings": monitor.get_resource_warnings()
         }
         
-        # Save report
-        report_path = self.output_dir / f"fuzzer_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        # Save report in the background, since the HTML version only reads it
+        report_path = self.output_dir / f"fuzzer_report_{file_timestamp()}.json"
+        json_future = None
+        if "json" in formats:
+            json_future = self._write_pool.submit(write_report, report_path, report, self.human_readable)
         
         # Generate HTML report
-        html_path = self._generate_html_report(report, report_path)
+        html_path = None
+        if "html" in formats:
+            html_path = self._generate_html_report(report, report_path)
+        
+        if json_future is not None:
+            report_path = json_future.result()
         
-        return str(html_path)
+        return str(html_path if html_path is not None else report_path)
     
     def _generate_summary(
         self,
@@ -117,132 +249,45 @@ class ReportGenerator:
         """
         html_path = json_path.with_suffix(".html")
         
-        # HTML template
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Redis Search Fuzzer Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .section { margin-bottom: 20px; }
-                .section h2 { color: #333; }
-                .summary { background-color: #f5f5f5; padding: 15px; border-radius: 5px; }
-                .error { color: #d32f2f; }
-                .warning { color: #f57c00; }
-                .success { color: #388e3c; }
-                table { border-collapse: collapse; width: 100%; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f5f5f5; }
-                tr:nth-child(even) { background-color: #f9f9f9; }
-            </style>
-        </head>
-        <body>
-            <h1>Redis Search Fuzzer Report</h1>
-            <p>Generated at: {timestamp}</p>
-            
-            <div class="section">
-                <h2>Summary</h2>
-                <div class="summary">
-                    <p>Total Queries: {total_queries}</p>
-                    <p>Success Rate: {success_rate:.2%}</p>
-                    <p>Validation Match Rate: {validation_match_rate:.2%}</p>
-                    <p>Total Errors: {total_errors}</p>
-                    <p>Total Warnings: {total_warnings}</p>
-                    <p>Total Crashes: {total_crashes}</p>
-                    <p>Total Execution Time: {total_time:.2f} seconds</p>
-                    <p>Average CPU Usage: {avg_cpu:.2f}%</p>
-                    <p>Average Memory Usage: {avg_memory:.2f}%</p>
-                    <p>Maximum Memory Usage: {max_memory} bytes</p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>Feature Coverage</h2>
-                <table>
-                    <tr>
-                        <th>Feature</th>
-                        <th>Coverage</th>
-                    </tr>
-                    {feature_coverage_rows}
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>Validation Errors</h2>
-                <table>
-                    <tr>
-                        <th>Query</th>
-                        <th>Expected</th>
-                        <th>Actual</th>
-                        <th>Errors</th>
-                    </tr>
-                    {validation_error_rows}
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>Slow Queries</h2>
-                <table>
-                    <tr>
-                        <th>Query</th>
-                        <th>Execution Time (ms)</th>
-                    </tr>
-                    {slow_query_rows}
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>Resource Warnings</h2>
-                <table>
-                    <tr>
-                        <th>Type</th>
-                        <th>Value</th>
-                        <th>Threshold</th>
-                    </tr>
-                    {resource_warning_rows}
-                </table>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Generate table rows
-        feature_coverage_rows = "\n".join(
-            f"<tr><td>{feature}</td><td>{coverage:.2%}</td></tr>"
+        # Generate table rows, escaping text that may contain markup characters
+        escape = html.escape
+        feature_coverage_rows = "\n".join([
+            _FEATURE_COVERAGE_ROW(escape(feature), coverage)
             for feature, coverage in report["feature_coverage"].items()
-        )
+        ])
         
-        validation_error_rows = "\n".join(
-            f"<tr><td>{error['query']}</td><td>{error['expected_valid']}</td>"
-            f"<td>{error['actual_valid']}</td><td>{', '.join(error['errors'])}</td></tr>"
+        validation_error_rows = "\n".join([
+            _VALIDATION_ERROR_ROW(
+                escape(error["query"]), error["expected_valid"],
+                error["actual_valid"], escape(", ".join(error["errors"]))
+            )
             for error in report["validation_errors"]
-        )
+        ])
         
-        slow_query_rows = "\n".join(
-            f"<tr><td>{query['query']}</td><td>{query['execution_time']}</td></tr>"
+        slow_query_rows = "\n".join([
+            _SLOW_QUERY_ROW(escape(query["query"]), query["execution_time"])
             for query in report["slow_queries"]
-        )
+        ])
         
-        resource_warning_rows = "\n".join(
-            f"<tr><td>{warning['type']}</td><td>{warning['value']}</td>"
-            f"<td>{warning['threshold']}</td></tr>"
+        resource_warning_rows = "\n".join([
+            _RESOURCE_WARNING_ROW(escape(warning["type"]), warning["value"], warning["threshold"])
             for warning in report["resource_warnings"]
-        )
+        ])
         
-        # Format the template
-        html_content = html_template.format(
+        # Fill in the template, with numbers formatted up front
+        summary = report["summary"]
+        html_content = _HTML_TEMPLATE.substitute(
             timestamp=report["timestamp"],
-            total_queries=report["summary"]["total_queries"],
-            success_rate=report["summary"]["success_rate"],
-            validation_match_rate=report["summary"]["validation_match_rate"],
-            total_errors=report["summary"]["total_errors"],
-            total_warnings=report["summary"]["total_warnings"],
-            total_crashes=report["summary"]["total_crashes"],
-            total_time=report["summary"]["total_execution_time"],
-            avg_cpu=report["summary"]["average_cpu_usage"],
-            avg_memory=report["summary"]["average_memory_usage"],
-            max_memory=report["summary"]["max_memory_usage"],
+            total_queries=summary["total_queries"],
+            success_rate=f"{summary['success_rate']:.2%}",
+            validation_match_rate=f"{summary['validation_match_rate']:.2%}",
+            total_errors=summary["total_errors"],
+            total_warnings=summary["total_warnings"],
+            total_crashes=summary["total_crashes"],
+            total_time=f"{summary['total_execution_time']:.2f}",
+            avg_cpu=f"{summary['average_cpu_usage']:.2f}",
+            avg_memory=f"{summary['average_memory_usage']:.2f}",
+            max_memory=summary["max_memory_usage"],
             feature_coverage_rows=feature_coverage_rows,
             validation_error_rows=validation_error_rows,
             slow_query_rows=slow_query_rows,
@@ -270,7 +315,7 @@ class ReportGenerator:
             Path to the generated report file.
         """
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "feature_coverage": validator.get_feature_coverage(),
             "missing_features": validator.get_missing_features(),
             "least_covered_features": validator.get_least_covered_features(),
@@ -278,9 +323,8 @@ class ReportGenerator:
         }
         
         # Save report
-        report_path = self.output_dir / f"feature_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        report_path = self.output_dir / f"feature_report_{file_timestamp()}.json"
+        report_path = write_report(report_path, report, self.human_readable)
         
         return str(report_path)
     
@@ -293,16 +337,10 @@ class ReportGenerator:
         Returns:
             Dictionary mapping features to their errors.
         """
-        feature_errors = {}
-        
-        for error in error_logger.errors:
-            if "feature" in error.get("details", {}):
-                feature = error["details"]["feature"]
-                if feature not in feature_errors:
-                    feature_errors[feature] = []
-                feature_errors[feature].append(error)
-        
-        return feature_errors
+        return {
+            feature: [error.to_dict() for error in errors]
+            for feature, errors in error_logger.feature_errors.items()
+        }
     
     def generate_performance_report(
         self,
@@ -319,7 +357,7 @@ class ReportGenerator:
             Path to the generated report file.
         """
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "resource_usage": monitor.get_summary_stats(),
             "slow_queries": executor.get_slow_queries(),
             "resource_warnings": monitor.get_resource_warnings(),
@@ -333,8 +371,7 @@ class ReportGenerator:
         }
         
         # Save report
-        report_path = self.output_dir / f"performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2)
+        report_path = self.output_dir / f"performance_report_{file_timestamp()}.json"
+        report_path = write_report(report_path, report, self.human_readable)
         
         return str(report_path)
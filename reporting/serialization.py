@@ -0,0 +1,140 @@
+import numpy as np
+import orjson
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+
+# Options for indented report files. Non-string keys and NumPy values are
+# accepted so statistics can be serialized without converting them first
+_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Options for serializing a lone mapping key the way it is written in reports
+_KEY_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Nesting levels whose containers are written member by member when streaming
+_STREAMED_LEVELS = 2
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: The object to serialize.
+        pretty: Whether to indent the output with two spaces.
+    
+    Returns:
+        The JSON document as bytes.
+    """
+    return orjson.dumps(obj, option=_PRETTY_OPTIONS if pretty else 0)
+
+
+def write_json(path: Union[str, Path], obj: Any) -> None:
+    """Write an object to a file as indented JSON.
+    
+    The output is identical to dumps(obj, pretty=True), including how
+    non-string keys are converted, but the top-level container and the
+    containers directly inside it are serialized member by member, so only
+    one member's encoding is held in memory at a time.
+    
+    Args:
+        path: Path of the file to write.
+        obj: The object to serialize.
+    """
+    with open(path, "wb") as f:
+        write = f.write
+        for chunk in _iter_chunks(obj, 0):
+            write(chunk)
+
+
+def _iter_chunks(obj: Any, level: int) -> Iterator[bytes]:
+    """Serialize an object as indented JSON in chunks.
+    
+    Args:
+        obj: The object to serialize.
+        level: Nesting level of the object, setting its indentation.
+    
+    Returns:
+        Iterator over the chunks of the JSON document.
+    """
+    indent = b"  " * level
+    if level >= _STREAMED_LEVELS or not isinstance(obj, (dict, list, tuple)) or not obj:
+        encoded = dumps(obj, pretty=True)
+        yield encoded.replace(b"\n", b"\n" + indent) if level else encoded
+        return
+    
+    member_indent = indent + b"  "
+    if isinstance(obj, dict):
+        yield b"{"
+        separator = b"\n"
+        for key, value in obj.items():
+            yield separator + member_indent + _dump_key(key) + b": "
+            yield from _iter_chunks(value, level + 1)
+            separator = b",\n"
+        yield b"\n" + indent + b"}"
+    else:
+        yield b"["
+        separator = b"\n"
+        for value in obj:
+            yield separator + member_indent
+            yield from _iter_chunks(value, level + 1)
+            separator = b",\n"
+        yield b"\n" + indent + b"]"
+
+
+def _dump_key(key: Any) -> bytes:
+    """Serialize a mapping key as the JSON string dumps would write for it.
+    
+    Args:
+        key: The key to serialize.
+    
+    Returns:
+        The key as a JSON string.
+    """
+    if isinstance(key, str):
+        return dumps(key)
+    
+    # Serializing through a one-entry mapping converts the key exactly like
+    # orjson does inside a whole document, e.g. True becomes "true"
+    encoded = orjson.dumps({key: None}, option=_KEY_OPTIONS)
+    return encoded[1:-len(b":null}")]
+
+
+def write_report(path: Path, obj: Any, human_readable: bool = True) -> Path:
+    """Write a report file as indented JSON or as MessagePack.
+    
+    Args:
+        path: Path of the JSON report file.
+        obj: The report to serialize.
+        human_readable: Whether to write indented JSON. If False, the report is
+            written as MessagePack to the same path with a ".msgpack" suffix.
+            
+    Returns:
+        Path of the written file.
+    """
+    if human_readable:
+        write_json(path, obj)
+        return path
+    
+    # Imported on first use, since JSON is the default report format
+    import msgpack
+    
+    path = path.with_suffix(".msgpack")
+    path.write_bytes(msgpack.packb(obj, use_bin_type=True, default=_msgpack_default))
+    return path
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert a value MessagePack cannot serialize natively.
+    
+    Args:
+        obj: The value to convert.
+        
+    Returns:
+        The value as built-in Python types.
+        
+    Raises:
+        TypeError: If the value is not a NumPy value.
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
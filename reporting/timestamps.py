@@ -0,0 +1,42 @@
+import time
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _iso_timestamp(ttl_hash: int) -> str:
+    """Format the current local time, memoized per time bucket.
+    
+    Args:
+        ttl_hash: Current time bucket. Calls within the same bucket share
+            the first call's timestamp.
+        
+    Returns:
+        The current local time in ISO 8601 format.
+    """
+    return datetime.now().isoformat()
+
+
+def iso_now() -> str:
+    """Get the current local time in ISO 8601 format.
+    
+    The formatted string is reused for all calls within the same millisecond,
+    so bursts of log entries do not each pay for building and formatting a
+    datetime.
+    
+    Returns:
+        The current local time in ISO 8601 format.
+    """
+    return _iso_timestamp(int(time.time() * 1000))
+
+
+def file_timestamp() -> str:
+    """Get the current local time formatted for use in file names.
+    
+    The fields are formatted as integers instead of through strftime.
+    
+    Returns:
+        The current local time as YYYYmmdd_HHMMSS.
+    """
+    now = datetime.now()
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"